@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from analyzer.model import Component, Graph
 from analysis.bounded_context import BoundedContextAnalysisResult
@@ -306,64 +306,68 @@ def group_migration_items_into_phases(items: List[MigrationItem]) -> List[Migrat
     return list(phase_map.values())
 
 
-def render_migration_plan_markdown(plan: MigrationPlan) -> str:
-    lines = [
-        f"# Migration Plan: {plan.current_project_name} → {plan.target_name}",
-        "",
-    ]
+def iter_migration_plan_markdown(plan: MigrationPlan) -> Iterator[str]:
+    yield f"# Migration Plan: {plan.current_project_name} → {plan.target_name}"
+    yield ""
     for phase in plan.phases:
-        lines.append(f"## {phase.name}")
-        lines.append("")
+        yield f"## {phase.name}"
+        yield ""
         for item in phase.items:
-            lines.append(f"- [ ] ({item.priority.value.upper()}) {item.title}")
-            lines.append(f"  - Type: {item.item_type.value}")
+            yield f"- [ ] ({item.priority.value.upper()}) {item.title}"
+            yield f"  - Type: {item.item_type.value}"
             if item.related_components:
-                lines.append(f"  - Components: {', '.join(item.related_components)}")
+                yield f"  - Components: {', '.join(item.related_components)}"
             if item.related_use_cases:
-                lines.append(f"  - Use Cases: {', '.join(item.related_use_cases)}")
+                yield f"  - Use Cases: {', '.join(item.related_use_cases)}"
             if item.related_bc_ids:
-                lines.append(f"  - Bounded Contexts: {', '.join(item.related_bc_ids)}")
-            lines.append(f"  - Rationale: {item.rationale}")
-            lines.append("")
-    return "\n".join(lines)
+                yield f"  - Bounded Contexts: {', '.join(item.related_bc_ids)}"
+            yield f"  - Rationale: {item.rationale}"
+            yield ""
 
 
-def render_migration_plan_csv(plan: MigrationPlan) -> str:
-    rows = [
-        "phase,item_id,priority,type,title,description,rationale,components,use_cases,bounded_contexts,tags"
-    ]
+def iter_migration_plan_csv(plan: MigrationPlan) -> Iterator[str]:
+    yield "phase,item_id,priority,type,title,description,rationale,components,use_cases,bounded_contexts,tags"
     for phase in plan.phases:
         for item in phase.items:
-            rows.append(
-                ",".join(
-                    [
-                        phase.name,
-                        item.id,
-                        item.priority.value,
-                        item.item_type.value,
-                        _csv(item.title),
-                        _csv(item.description),
-                        _csv(item.rationale),
-                        _csv(";".join(item.related_components)),
-                        _csv(";".join(item.related_use_cases)),
-                        _csv(";".join(item.related_bc_ids)),
-                        _csv(";".join(item.tags)),
-                    ]
-                )
+            yield ",".join(
+                [
+                    phase.name,
+                    item.id,
+                    item.priority.value,
+                    item.item_type.value,
+                    _csv(item.title),
+                    _csv(item.description),
+                    _csv(item.rationale),
+                    _csv(";".join(item.related_components)),
+                    _csv(";".join(item.related_use_cases)),
+                    _csv(";".join(item.related_bc_ids)),
+                    _csv(";".join(item.tags)),
+                ]
             )
-    return "\n".join(rows)
 
 
-def render_migration_plan_plain(plan: MigrationPlan) -> str:
-    lines = [f"Migration Plan: {plan.current_project_name} -> {plan.target_name}", ""]
+def iter_migration_plan_plain(plan: MigrationPlan) -> Iterator[str]:
+    yield f"Migration Plan: {plan.current_project_name} -> {plan.target_name}"
+    yield ""
     for phase in plan.phases:
-        lines.append(phase.name)
+        yield phase.name
         for item in phase.items:
-            lines.append(f"- ({item.priority.value.upper()}) {item.title}")
-            lines.append(f"  {item.description}")
-            lines.append(f"  Rationale: {item.rationale}")
-        lines.append("")
-    return "\n".join(lines)
+            yield f"- ({item.priority.value.upper()}) {item.title}"
+            yield f"  {item.description}"
+            yield f"  Rationale: {item.rationale}"
+        yield ""
+
+
+def render_migration_plan_markdown(plan: MigrationPlan) -> str:
+    return "\n".join(iter_migration_plan_markdown(plan))
+
+
+def render_migration_plan_csv(plan: MigrationPlan) -> str:
+    return "\n".join(iter_migration_plan_csv(plan))
+
+
+def render_migration_plan_plain(plan: MigrationPlan) -> str:
+    return "\n".join(iter_migration_plan_plain(plan))
 
 
 def _csv(value: str) -> str:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
 
+from core.utils import read_json
+
 
 @dataclass
 class TargetUseCaseBlueprint:
@@ -33,7 +34,7 @@ class TargetArchitectureSpec:
 
 
 def load_target_architecture_spec(path: str | Path) -> TargetArchitectureSpec:
-    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    data = read_json(Path(path))
     name = data.get("name") or Path(path).stem
 
     bc_specs: Dict[str, TargetBoundedContextSpec] = {}
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import enum
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, NamedTuple, Tuple
+from typing import DefaultDict, Dict, List, NamedTuple, Tuple
 
 from analyzer.model import Component, Dependency, Graph
 
@@ -176,6 +177,17 @@ def score_project(violations: List[RuleViolation]) -> int:
     return max(0, score)
 
 
+def index_violations_by_component(
+    violations: List[RuleViolation],
+) -> DefaultDict[str, List[RuleViolation]]:
+    index: DefaultDict[str, List[RuleViolation]] = defaultdict(list)
+    for violation in violations:
+        index[violation.source_component_id].append(violation)
+        if violation.target_component_id:
+            index[violation.target_component_id].append(violation)
+    return index
+
+
 def run_rule_analysis(graph: Graph) -> tuple[List[RuleViolation], RuleAnalysisSummary]:
     violations = analyze_layer_rules(graph)
     violations_by_rule: Dict[str, int] = {}
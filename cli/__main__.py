@@ -4,7 +4,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from cli.commands import analyze_command, analyze_rules_command, load_graph_command, open_ui
+from cli.commands import analyze_command, analyze_rules_command, open_ui
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -28,18 +28,17 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
     if args.command == "analyze":
-        output_path, graph = analyze_command(
+        output_path, _ = analyze_command(
             Path(args.project_path), Path(args.output) if args.output else None
         )
         print(f"Graph written to {output_path}")
         if args.no_ui:
             return 0
-        return open_ui(graph, Path(args.project_path))
+        return open_ui(output_path, Path(args.project_path))
 
     if args.command == "open":
         graph_path = Path(args.graph_path).resolve()
-        graph = load_graph_command(graph_path)
-        return open_ui(graph, graph_path.parent)
+        return open_ui(graph_path, graph_path.parent)
 
     if args.command == "rules":
         return analyze_rules_command(Path(args.graph_path).resolve())
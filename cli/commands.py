@@ -15,10 +15,6 @@ def analyze_command(project_path: Path, output_path: Path | None) -> Tuple[Path,
     return output, graph
 
 
-def load_graph_command(graph_path: Path) -> object:
-    return load_graph(graph_path)
-
-
 def analyze_rules_command(graph_path: Path) -> int:
     graph = load_graph(graph_path)
     violations, summary = run_rule_analysis(graph)
@@ -36,7 +32,7 @@ def analyze_rules_command(graph_path: Path) -> int:
     return 0
 
 
-def open_ui(graph, project_root: Path | None, watch: bool = False) -> int:
+def open_ui(graph_path: Path, project_root: Path | None, watch: bool = False) -> int:
     try:
         from PySide6.QtWidgets import QApplication
 
@@ -47,11 +43,6 @@ def open_ui(graph, project_root: Path | None, watch: bool = False) -> int:
 
     app = QApplication([])
     window = MainWindow()
-    if project_root:
-        window.project_root = project_root
-        window.inspector.set_base_path(project_root)
-    window._load_graph(graph)
-    if watch and project_root:
-        window.start_watch(project_root)
     window.show()
+    window.open_graph_file(graph_path, project_root, watch=watch and project_root is not None)
     return app.exec()
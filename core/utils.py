@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def normalize_annotation(name: str) -> str:
@@ -23,3 +29,16 @@ def unique(seq: Iterable[str]) -> list[str]:
             seen.add(item)
             out.append(item)
     return out
+
+
+def read_json(path: Path) -> Any:
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json(path: Path, data: Any) -> None:
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
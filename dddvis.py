@@ -19,13 +19,13 @@ def main() -> int:
 
     project_root = Path(args.project).resolve()
     output_path = Path(args.output).resolve() if args.output else None
-    output_path, graph = analyze_command(project_root, output_path)
+    output_path, _ = analyze_command(project_root, output_path)
     print(f"Graph written to {output_path}")
 
     if args.no_ui:
         return 0
 
-    return open_ui(graph, project_root, watch=True)
+    return open_ui(output_path, project_root, watch=True)
 
 
 if __name__ == "__main__":
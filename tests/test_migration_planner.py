@@ -0,0 +1,113 @@
+from analysis.migration_planner import (
+    MigrationItem,
+    MigrationItemType,
+    MigrationPhase,
+    MigrationPlan,
+    MigrationPriority,
+    iter_migration_plan_csv,
+    iter_migration_plan_markdown,
+    iter_migration_plan_plain,
+    render_migration_plan_csv,
+    render_migration_plan_markdown,
+    render_migration_plan_plain,
+)
+
+
+def _plan() -> MigrationPlan:
+    move = MigrationItem(
+        id="layer-1",
+        item_type=MigrationItemType.MOVE_TO_LAYER,
+        priority=MigrationPriority.HIGH,
+        title="Move OrderRepository",
+        description="Repository lives in domain, move it",
+        rationale="Domain must not depend on JPA",
+        related_components=["domain.OrderRepository"],
+        related_use_cases=["PlaceOrder"],
+        related_bc_ids=["order"],
+        tags=["layer", "jpa"],
+    )
+    event = MigrationItem(
+        id="uc-2",
+        item_type=MigrationItemType.INTRODUCE_EVENT,
+        priority=MigrationPriority.LOW,
+        title='Publish "OrderPlaced", async',
+        description="Line one\nline two",
+        rationale="Decouple payment",
+        related_components=[],
+        related_use_cases=[],
+        related_bc_ids=[],
+        tags=[],
+    )
+    return MigrationPlan(
+        current_project_name="shop",
+        target_name="Hexagonal",
+        phases=[
+            MigrationPhase(id="phase-1", name="Phase 1: Layers", description="", items=[move]),
+            MigrationPhase(id="phase-2", name="Phase 2: Events", description="", items=[event]),
+        ],
+        all_items=[move, event],
+    )
+
+
+# Output of the list-building render_* implementations before they were
+# rewritten on top of the iter_* generators.
+EXPECTED_MARKDOWN = (
+    "# Migration Plan: shop → Hexagonal\n"
+    "\n"
+    "## Phase 1: Layers\n"
+    "\n"
+    "- [ ] (HIGH) Move OrderRepository\n"
+    "  - Type: move_to_layer\n"
+    "  - Components: domain.OrderRepository\n"
+    "  - Use Cases: PlaceOrder\n"
+    "  - Bounded Contexts: order\n"
+    "  - Rationale: Domain must not depend on JPA\n"
+    "\n"
+    "## Phase 2: Events\n"
+    "\n"
+    '- [ ] (LOW) Publish "OrderPlaced", async\n'
+    "  - Type: introduce_event\n"
+    "  - Rationale: Decouple payment\n"
+)
+
+EXPECTED_CSV = (
+    "phase,item_id,priority,type,title,description,rationale,components,use_cases,"
+    "bounded_contexts,tags\n"
+    "Phase 1: Layers,layer-1,high,move_to_layer,Move OrderRepository,"
+    '"Repository lives in domain, move it",Domain must not depend on JPA,'
+    "domain.OrderRepository,PlaceOrder,order,layer;jpa\n"
+    'Phase 2: Events,uc-2,low,introduce_event,"Publish ""OrderPlaced"", async",'
+    '"Line one\nline two",Decouple payment,,,,'
+)
+
+EXPECTED_PLAIN = (
+    "Migration Plan: shop -> Hexagonal\n"
+    "\n"
+    "Phase 1: Layers\n"
+    "- (HIGH) Move OrderRepository\n"
+    "  Repository lives in domain, move it\n"
+    "  Rationale: Domain must not depend on JPA\n"
+    "\n"
+    "Phase 2: Events\n"
+    '- (LOW) Publish "OrderPlaced", async\n'
+    "  Line one\nline two\n"
+    "  Rationale: Decouple payment\n"
+)
+
+
+def test_markdown_matches_previous_render_output() -> None:
+    plan = _plan()
+    assert "\n".join(iter_migration_plan_markdown(plan)) == EXPECTED_MARKDOWN
+    assert render_migration_plan_markdown(plan) == EXPECTED_MARKDOWN
+
+
+def test_csv_matches_previous_render_output() -> None:
+    plan = _plan()
+    assert "\n".join(iter_migration_plan_csv(plan)) == EXPECTED_CSV
+    assert render_migration_plan_csv(plan) == EXPECTED_CSV
+
+
+def test_plain_matches_previous_render_output() -> None:
+    plan = _plan()
+    assert "\n".join(iter_migration_plan_plain(plan)) == EXPECTED_PLAIN
+    assert render_migration_plan_plain(plan) == EXPECTED_PLAIN
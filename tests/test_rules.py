@@ -1,5 +1,9 @@
 from analyzer.model import Component, Dependency, Graph
-from architecture.rules import analyze_layer_rules, run_rule_analysis
+from architecture.rules import (
+    analyze_layer_rules,
+    index_violations_by_component,
+    run_rule_analysis,
+)
 
 
 def test_domain_depends_on_adapter_violation() -> None:
@@ -67,3 +71,26 @@ def test_application_depends_on_adapter_violation() -> None:
     )
     violations = analyze_layer_rules(graph)
     assert any(v.rule_id == "APPLICATION_DEPENDS_ON_ADAPTER" for v in violations)
+
+
+def test_index_violations_by_component_lists_both_ends() -> None:
+    graph = Graph(
+        components=[
+            Component(id="domain.Order", name="Order", path="", package="", layer="domain"),
+            Component(
+                id="adapter.OrderController",
+                name="OrderController",
+                path="",
+                package="",
+                layer="inbound_adapter",
+            ),
+        ],
+        dependencies=[
+            Dependency(source_id="domain.Order", target_id="adapter.OrderController", kind="import")
+        ],
+    )
+    violations, _ = run_rule_analysis(graph)
+    index = index_violations_by_component(violations)
+    assert index["domain.Order"] == violations
+    assert index["adapter.OrderController"] == violations
+    assert "missing" not in index
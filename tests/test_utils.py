@@ -0,0 +1,39 @@
+import pytest
+
+import core.utils
+from core.utils import read_json, write_json
+
+DATA = {
+    "name": "자동 생성 타깃",
+    "boundedContexts": [{"id": "order", "packages": ["com.shop.order"]}],
+    "moduleGuidelines": {"allowDirectAdapterToDomain": False},
+    "expectedEvents": [],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(core.utils, "orjson", None)
+    return request.param
+
+
+def test_write_then_read_round_trips(tmp_path, json_backend) -> None:
+    path = tmp_path / "target.json"
+    write_json(path, DATA)
+    assert read_json(path) == DATA
+    text = path.read_text(encoding="utf-8")
+    assert "자동 생성 타깃" in text
+    assert text.startswith('{\n  "name"')
+
+
+def test_backends_write_identical_files(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    fast = tmp_path / "fast.json"
+    write_json(fast, DATA)
+    monkeypatch.setattr(core.utils, "orjson", None)
+    plain = tmp_path / "plain.json"
+    write_json(plain, DATA)
+    assert fast.read_bytes() == plain.read_bytes()
@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from ui.main_window import _watch_snapshot_changed
+
+
+def test_touch_with_same_hash_is_ignored() -> None:
+    previous = {"Order.java": (1.0, b"digest")}
+    current = {"Order.java": (2.0, b"digest")}
+    assert not _watch_snapshot_changed(previous, current)
+
+
+def test_content_change_is_detected() -> None:
+    previous = {"Order.java": (1.0, b"before")}
+    current = {"Order.java": (2.0, b"after")}
+    assert _watch_snapshot_changed(previous, current)
+
+
+def test_unhashed_file_mtime_change_is_detected() -> None:
+    previous = {"ddd_target.json": (1.0, None)}
+    current = {"ddd_target.json": (2.0, None)}
+    assert _watch_snapshot_changed(previous, current)
+
+
+def test_added_or_removed_file_is_detected() -> None:
+    previous = {"Order.java": (1.0, b"digest")}
+    current = {**previous, "Payment.java": (1.0, b"other")}
+    assert _watch_snapshot_changed(previous, current)
+    assert _watch_snapshot_changed(current, previous)
+
+
+def test_identical_snapshot_is_unchanged() -> None:
+    snapshot = {"Order.java": (1.0, b"digest")}
+    assert not _watch_snapshot_changed(snapshot, dict(snapshot))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from analyzer.model import Graph
+from analyzer.pipeline import analyze_project
+from analysis.bounded_context import BoundedContextAnalysisResult, analyze_bounded_contexts
+from analysis.event_readiness import EventReadinessAnalysisResult, analyze_project_event_readiness
+from analysis.smells import (
+    ComponentMetricsProvider,
+    ProjectSmellSummary,
+    analyze_project_smells,
+)
+from analysis.use_case_report import UseCaseReportSet, build_use_case_reports
+from architecture.rules import (
+    RuleAnalysisSummary,
+    index_violations_by_component,
+    run_rule_analysis,
+)
+from core.graph_loader import load_graph
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    graph: Graph
+    violations: list
+    rule_summary: RuleAnalysisSummary
+    smell_summary: ProjectSmellSummary
+    bc_analysis: BoundedContextAnalysisResult
+    event_readiness: EventReadinessAnalysisResult
+    use_case_reports: UseCaseReportSet
+    graph_path: Path | None = None
+
+
+class AnalysisWorkerSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class AnalysisWorker(QRunnable):
+    """Runs project analysis and the per-graph analyses off the GUI thread.
+
+    With ``graph_path`` set, the graph is read from that JSON file instead of
+    analyzing ``project_root``.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        output_path: Path | None = None,
+        graph_path: Path | None = None,
+    ) -> None:
+        super().__init__()
+        self._project_root = project_root
+        self._output_path = output_path
+        self._graph_path = graph_path
+        self.signals = AnalysisWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            if self._graph_path:
+                graph = load_graph(self._graph_path)
+            else:
+                graph = analyze_project(self._project_root, self._output_path)
+            violations, rule_summary = run_rule_analysis(graph)
+            components = {component.id: component for component in graph.components}
+            smell_summary = analyze_project_smells(graph, ComponentMetricsProvider(components))
+            bc_analysis = analyze_bounded_contexts(graph)
+            rules_index = index_violations_by_component(violations)
+            event_readiness = analyze_project_event_readiness(graph, rules_index)
+            use_case_reports = build_use_case_reports(
+                graph, rules_index, smell_summary, event_readiness, bc_analysis
+            )
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(
+            AnalysisResult(
+                graph,
+                violations,
+                rule_summary,
+                smell_summary,
+                bc_analysis,
+                event_readiness,
+                use_case_reports,
+                self._graph_path,
+            )
+        )
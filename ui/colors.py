@@ -45,3 +45,4 @@ SMELL_COLORS = {
     "repository_leak": QColor("#2563EB"),
     "cross_aggregate_coupling": QColor("#8B5CF6"),
 }
+SMELL_COLOR_NAMES = {key: color.name() for key, color in SMELL_COLORS.items()}
@@ -10,9 +10,6 @@ from ui.colors import FLOW_ACTIVE, FLOW_DIM, FLOW_IN, FLOW_VISITED, STROKE_COLOR
 
 
 class ComponentItem(QGraphicsObject):
-    clicked = Signal(object)
-    hovered = Signal(object, bool)
-    double_clicked = Signal(object)
     position_changed = Signal()
 
     def __init__(self, component: Component, layout: LayoutConfig | None = None) -> None:
@@ -117,7 +114,9 @@ class ComponentItem(QGraphicsObject):
             self._drag_start_pos = event.pos()
             # 클릭 피드백: 살짝 스케일 다운
             self.setScale(0.96)
-        self.clicked.emit(self.component)
+        scene = self.scene()
+        if scene is not None:
+            scene.component_clicked.emit(self.component)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
@@ -159,7 +158,9 @@ class ComponentItem(QGraphicsObject):
         self.setScale(1.04)
         self.setCursor(Qt.CursorShape.OpenHandCursor)  # 드래그 가능 표시
         self.update()
-        self.hovered.emit(self.component, True)
+        scene = self.scene()
+        if scene is not None:
+            scene.component_hovered.emit(self.component, True)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event) -> None:  # type: ignore[override]
@@ -168,11 +169,15 @@ class ComponentItem(QGraphicsObject):
         self.setScale(1.0)
         self.setCursor(Qt.CursorShape.ArrowCursor)
         self.update()
-        self.hovered.emit(self.component, False)
+        scene = self.scene()
+        if scene is not None:
+            scene.component_hovered.emit(self.component, False)
         super().hoverLeaveEvent(event)
 
     def mouseDoubleClickEvent(self, event) -> None:  # type: ignore[override]
-        self.double_clicked.emit(self.component)
+        scene = self.scene()
+        if scene is not None:
+            scene.component_double_clicked.emit(self.component)
         super().mouseDoubleClickEvent(event)
 
     def set_active(self, active: bool) -> None:
@@ -284,6 +289,9 @@ class ComponentItem(QGraphicsObject):
     def itemChange(self, change, value):  # type: ignore[override]
         if change == QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged:
             self.position_changed.emit()
+            scene = self.scene()
+            if scene is not None:
+                scene.component_moved.emit()
         return super().itemChange(change, value)
 
     def _label_font(self) -> QFont:
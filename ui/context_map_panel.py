@@ -7,6 +7,8 @@ from analysis.bounded_context import BcRelation, BoundedContext
 
 
 class ContextMapInfoPanel(QWidget):
+    SKIP_DOCK_SCROLL_WRAPPER = True
+
     def __init__(self) -> None:
         super().__init__()
         self.title = QLabel("컨텍스트 맵 정보")
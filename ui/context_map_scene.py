@@ -97,6 +97,7 @@ class BcRelationItem(QGraphicsPathItem):
     def paint(self, painter: QPainter, option, widget=None) -> None:  # type: ignore[override]
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setPen(self.pen())
+        painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawPath(self.path())
         if self.path().elementCount() < 2:
             return
@@ -21,6 +21,7 @@ class EdgeItem(QGraphicsItem):
         self._violation_level: str | None = None
         self._path = QPainterPath()
         self._arrow = QPolygonF()
+        self._arrow_bounds = QRectF()
         self._bounding = QRectF()
         self._start = QPointF()
         self._end = QPointF()
@@ -56,7 +57,8 @@ class EdgeItem(QGraphicsItem):
         painter.setPen(pen)
         painter.setBrush(self._arrow_brush())
         painter.drawPath(self._path)
-        if not self._arrow.isEmpty():
+        # 부분 갱신 시 노출 영역 밖의 화살촉은 그리지 않는다.
+        if not self._arrow.isEmpty() and option.exposedRect.intersects(self._arrow_bounds):
             painter.drawPolygon(self._arrow)
 
     def update_positions(self) -> None:
@@ -70,6 +72,7 @@ class EdgeItem(QGraphicsItem):
         self.prepareGeometryChange()
         self._path = path
         self._arrow = arrow
+        self._arrow_bounds = arrow.boundingRect().adjusted(-2, -2, 2, 2)
         self._bounding = self._path.boundingRect().adjusted(-6, -6, 6, 6)
         self.update()
 
@@ -19,6 +19,7 @@ from analysis.event_readiness import EventReadinessAnalysisResult
 
 class EventReadinessPanel(QWidget):
     use_case_selected = Signal(str)
+    SKIP_DOCK_SCROLL_WRAPPER = True
 
     def __init__(self) -> None:
         super().__init__()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class ExportWorkerSignals(QObject):
+    finished = Signal(str)
+    failed = Signal(str, str)
+
+
+class ExportWorker(QRunnable):
+    """Renders export lines and streams them to ``path`` off the GUI thread.
+
+    ``render`` returns the document as lines without trailing newlines;
+    they are written separated by newlines.
+    """
+
+    def __init__(self, path: Path, render: Callable[[], Iterable[str]]) -> None:
+        super().__init__()
+        self._path = path
+        self._render = render
+        self.signals = ExportWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            with self._path.open("w", encoding="utf-8") as handle:
+                separator = ""
+                for line in self._render():
+                    handle.write(separator)
+                    handle.write(line)
+                    separator = "\n"
+        except Exception as exc:
+            self.signals.failed.emit(str(self._path), str(exc))
+            return
+        self.signals.finished.emit(str(self._path))
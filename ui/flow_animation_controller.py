@@ -20,6 +20,7 @@ class FlowStep:
 class FlowAnimationController(QObject):
     step_changed = Signal(int)
     token_updated = Signal()
+    finished = Signal()
 
     def __init__(self, scene, steps: List[FlowStep]) -> None:
         super().__init__()
@@ -116,7 +117,7 @@ class FlowAnimationController(QObject):
         if self._group.animationCount() > 0:
             self._group.currentAnimationChanged.connect(self._on_step_changed)
             self._group_connected = True
-        self._group.finished.connect(self.stop)
+        self._group.finished.connect(self._on_finished)
 
     def _reset_group(self) -> None:
         if self._group_connected:
@@ -127,6 +128,10 @@ class FlowAnimationController(QObject):
         self._group.deleteLater()
         self._group = QSequentialAnimationGroup(self)
 
+    def _on_finished(self) -> None:
+        self.stop()
+        self.finished.emit()
+
     def _on_step_changed(self, animation) -> None:
         if animation is None:
             return
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable
 
 from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QDesktopServices
@@ -19,6 +20,8 @@ from PySide6.QtWidgets import (
 
 from analyzer.model import Component
 
+FLOW_SPEEDS = {"0.5x": 0.5, "1x": 1.0, "1.5x": 1.5, "2x": 2.0}
+
 
 class InspectorPanel(QWidget):
     def __init__(self) -> None:
@@ -45,7 +48,7 @@ class InspectorPanel(QWidget):
             "font-family: 'Gmarket Sans'; font-weight: 700; font-size: 13px;"
         )
         self.flow_speed = QComboBox()
-        self.flow_speed.addItems(["0.5x", "1x", "1.5x", "2x"])
+        self.flow_speed.addItems(list(FLOW_SPEEDS))
         self.flow_speed.setCurrentText("1x")
         self.flow_list = QListWidget()
         self.flow_list.setFixedHeight(180)
@@ -210,13 +213,13 @@ class InspectorPanel(QWidget):
     def current_component(self) -> Component | None:
         return self._current_component
 
-    def show_component_violations(self, items: list[str]) -> None:
+    def show_component_violations(self, items: Iterable[str]) -> None:
         self.violations_list.clear()
         for item in items:
-            self.violations_list.addItem(QListWidgetItem(item))
+            self.violations_list.addItem(item)
         self.violations_title.setVisible(True)
         self.violations_list.setVisible(True)
-        if not items:
+        if not self.violations_list.count():
             self.violations_list.addItem(QListWidgetItem("위반 없음"))
 
     def clear_component_violations(self) -> None:
@@ -224,13 +227,13 @@ class InspectorPanel(QWidget):
         self.violations_list.setVisible(False)
         self.violations_title.setVisible(False)
 
-    def show_component_smells(self, items: list[str]) -> None:
+    def show_component_smells(self, items: Iterable[str]) -> None:
         self.smells_list.clear()
         for item in items:
-            self.smells_list.addItem(QListWidgetItem(item))
+            self.smells_list.addItem(item)
         self.smells_title.setVisible(True)
         self.smells_list.setVisible(True)
-        if not items:
+        if not self.smells_list.count():
             self.smells_list.addItem(QListWidgetItem("스멜 없음"))
 
     def clear_component_smells(self) -> None:
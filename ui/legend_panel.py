@@ -1,9 +1,57 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget, QFrame
 
 from core.config import LAYER_COLORS
-from ui.colors import SMELL_COLORS, TEXT_SECONDARY
+from ui.colors import SMELL_COLOR_NAMES, TEXT_SECONDARY
+
+_LAYER_ROWS = (
+    ("도메인", "domain", "핵심 비즈니스 규칙"),
+    ("애플리케이션", "application", "유스케이스/흐름"),
+    ("인바운드 포트", "inbound_port", "입력 포트 / 유스케이스 인터페이스"),
+    ("아웃바운드 포트", "outbound_port", "출력 포트 / 게이트웨이 인터페이스"),
+    ("인바운드 어댑터", "inbound_adapter", "입력 어댑터"),
+    ("아웃바운드 어댑터", "outbound_adapter", "출력 어댑터"),
+    ("미분류", "unknown", "미분류"),
+)
+
+_SMELL_ROWS = (
+    ("빈약한 도메인", "anemic_domain", "빈약한 도메인 모델"),
+    ("갓 서비스", "god_service", "과도한 서비스/트랜잭션 스크립트"),
+    ("레포지토리 누수", "repository_leak", "ORM/인프라 누수"),
+    ("크로스 애그리게잇", "cross_aggregate_coupling", "애그리게잇 경계 혼합"),
+)
+
+_PANEL_STYLE = (
+    "QFrame#legendCard QLabel, QFrame#smellsCard QLabel { font-size: 12px; }"
+    "QFrame#legendCard { border: 1px solid palette(mid); border-radius: 12px; }"
+    "QFrame#smellsCard { border: 1px solid palette(mid); border-radius: 12px; }"
+)
+
+_HEADER_FONT = QFont("Gmarket Sans")
+_HEADER_FONT.setWeight(QFont.Weight.Bold)
+_HEADER_FONT.setPixelSize(14)
+
+_TITLE_FONT = QFont("Gmarket Sans")
+_TITLE_FONT.setWeight(QFont.Weight.DemiBold)
+_TITLE_FONT.setPixelSize(12)
+
+
+@lru_cache(maxsize=None)
+def _dot_pixmap(color_hex: str) -> QPixmap:
+    pixmap = QPixmap(12, 12)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(color_hex))
+    painter.drawEllipse(0, 0, 12, 12)
+    painter.end()
+    return pixmap
 
 
 class LegendPanel(QWidget):
@@ -15,9 +63,7 @@ class LegendPanel(QWidget):
         layout.setSpacing(12)
 
         header = QLabel("범례")
-        header.setStyleSheet(
-            "font-family: 'Gmarket Sans'; font-weight: 700; font-size: 14px;"
-        )
+        header.setFont(_HEADER_FONT)
         layout.addWidget(header)
 
         legend_card = QFrame()
@@ -27,29 +73,17 @@ class LegendPanel(QWidget):
         legend_card_layout.setSpacing(8)
 
         title_legend = QLabel("레이어")
-        title_legend.setStyleSheet(
-            "font-family: 'Gmarket Sans'; font-weight: 600; font-size: 12px;"
-        )
+        title_legend.setFont(_TITLE_FONT)
         legend_card_layout.addWidget(title_legend)
         legend_layout = QVBoxLayout()
         legend_layout.setSpacing(6)
-        for name, layer_key, description in [
-            ("도메인", "domain", "핵심 비즈니스 규칙"),
-            ("애플리케이션", "application", "유스케이스/흐름"),
-            ("인바운드 포트", "inbound_port", "입력 포트 / 유스케이스 인터페이스"),
-            ("아웃바운드 포트", "outbound_port", "출력 포트 / 게이트웨이 인터페이스"),
-            ("인바운드 어댑터", "inbound_adapter", "입력 어댑터"),
-            ("아웃바운드 어댑터", "outbound_adapter", "출력 어댑터"),
-            ("미분류", "unknown", "미분류"),
-        ]:
+        for name, layer_key, description in _LAYER_ROWS:
             row = QWidget()
             row_layout = QHBoxLayout(row)
             row_layout.setContentsMargins(0, 0, 0, 0)
             dot = QLabel()
             dot.setFixedSize(12, 12)
-            dot.setStyleSheet(
-                f"background-color: {LAYER_COLORS[layer_key]}; border-radius: 6px;"
-            )
+            dot.setPixmap(_dot_pixmap(LAYER_COLORS[layer_key]))
             row_layout.addWidget(dot)
             label = QLabel(f"{name} – {description}")
             label.setStyleSheet(f"color: {TEXT_SECONDARY.name()};")
@@ -67,26 +101,17 @@ class LegendPanel(QWidget):
         smells_card_layout.setSpacing(8)
 
         title_smells = QLabel("스멜")
-        title_smells.setStyleSheet(
-            "font-family: 'Gmarket Sans'; font-weight: 600; font-size: 12px;"
-        )
+        title_smells.setFont(_TITLE_FONT)
         smells_card_layout.addWidget(title_smells)
         smells_layout = QVBoxLayout()
         smells_layout.setSpacing(6)
-        for name, color_key, description in [
-            ("빈약한 도메인", "anemic_domain", "빈약한 도메인 모델"),
-            ("갓 서비스", "god_service", "과도한 서비스/트랜잭션 스크립트"),
-            ("레포지토리 누수", "repository_leak", "ORM/인프라 누수"),
-            ("크로스 애그리게잇", "cross_aggregate_coupling", "애그리게잇 경계 혼합"),
-        ]:
+        for name, color_key, description in _SMELL_ROWS:
             row = QWidget()
             row_layout = QHBoxLayout(row)
             row_layout.setContentsMargins(0, 0, 0, 0)
             dot = QLabel()
             dot.setFixedSize(12, 12)
-            dot.setStyleSheet(
-                f"background-color: {SMELL_COLORS[color_key].name()}; border-radius: 6px;"
-            )
+            dot.setPixmap(_dot_pixmap(SMELL_COLOR_NAMES[color_key]))
             row_layout.addWidget(dot)
             label = QLabel(f"{name} – {description}")
             label.setStyleSheet(f"color: {TEXT_SECONDARY.name()};")
@@ -97,8 +122,4 @@ class LegendPanel(QWidget):
         smells_card_layout.addLayout(smells_layout)
         layout.addWidget(smells_card)
         layout.addStretch(1)
-        self.setStyleSheet(
-            "QLabel { font-size: 12px; }"
-            "QFrame#legendCard { border: 1px solid palette(mid); border-radius: 12px; }"
-            "QFrame#smellsCard { border: 1px solid palette(mid); border-radius: 12px; }"
-        )
+        self.setStyleSheet(_PANEL_STYLE)
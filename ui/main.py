@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -14,23 +15,24 @@ FONT_FILES = [
     "GmarketSans-Bold.ttf",
 ]
 
+FONT_FALLBACKS = ["SUIT", "Noto Sans KR", "Apple SD Gothic Neo", "Malgun Gothic"]
+
 
 def main() -> int:
     app = QApplication(sys.argv)
     font_dir = Path(__file__).resolve().parent / "assets" / "fonts"
+    try:
+        present = {entry.name for entry in os.scandir(font_dir)}
+    except OSError:
+        present = set()
     for filename in FONT_FILES:
-        font_path = font_dir / filename
-        if font_path.exists():
-            QFontDatabase.addApplicationFont(str(font_path))
+        if filename in present:
+            QFontDatabase.addApplicationFont(str(font_dir / filename))
+    QFont.insertSubstitutions("Pretendard", FONT_FALLBACKS)
 
     font = QFont("Pretendard")
-    font.setStyleHint(QFont.StyleHint.SansSerif)
-    font.setPointSize(11)
+    font.setPixelSize(14)
     app.setFont(font)
-    app.setStyleSheet(
-        "QWidget { font-family: 'Pretendard', 'SUIT', 'Noto Sans KR',"
-        " 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif; }"
-    )
     window = MainWindow()
     window.show()
     return app.exec()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QUrl, QTimer
+from PySide6.QtCore import Qt, QThreadPool, QUrl, QTimer
 from PySide6.QtGui import QAction, QDesktopServices, QColor, QPainter, QBrush, QPixmap, QPen
 from PySide6.QtWidgets import (
-    QApplication,
     QComboBox,
+    QDialog,
     QDockWidget,
     QHBoxLayout,
     QFileDialog,
@@ -14,6 +16,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPushButton,
     QSizePolicy,
     QStackedWidget,
     QToolBar,
@@ -22,25 +25,30 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QWidget,
 )
+import hashlib
 import json
+import os
+from json.encoder import encode_basestring
 
-from analyzer.pipeline import analyze_project
-from architecture.rules import run_rule_analysis
+from architecture.rules import RuleAnalysisSummary, index_violations_by_component, run_rule_analysis
 from analysis.smells import ComponentMetricsProvider, analyze_project_smells
 from analysis.bounded_context import analyze_bounded_contexts, BoundedContextAnalysisResult
 from analysis.target_architecture import load_target_architecture_spec, TargetArchitectureSpec
 from analysis.migration_planner import (
     build_migration_plan,
-    render_migration_plan_csv,
-    render_migration_plan_markdown,
-    render_migration_plan_plain,
+    iter_migration_plan_csv,
+    iter_migration_plan_markdown,
+    iter_migration_plan_plain,
 )
-from core.flow import compute_flow_path
+from core.config import Theme, ThemeManager
+from core.flow import FlowResult, compute_flow_path
 from analysis.event_readiness import analyze_project_event_readiness
-from core.graph_loader import load_graph
 from core.use_case_utils import is_use_case_entry
+from core.utils import read_json, write_json
 from analysis.use_case_report import build_use_case_reports, UseCaseReportSet
-from ui.inspector_panel import InspectorPanel
+from ui.analysis_worker import AnalysisResult, AnalysisWorker
+from ui.export_worker import ExportWorker
+from ui.inspector_panel import FLOW_SPEEDS, InspectorPanel
 from ui.left_sidebar import LeftSidebar
 from ui.rules_panel import ArchitectureRulesPanel
 from ui.smells_panel import SmellsPanel, smell_color_key
@@ -56,6 +64,371 @@ from ui.flow_animation_controller import FlowAnimationController, FlowStep
 from ui.scene import ArchitectureScene
 from ui.use_case_report_panel import UseCaseReportPanel
 
+_DOCK_FEATURES = (
+    QDockWidget.DockWidgetFeature.DockWidgetMovable
+    | QDockWidget.DockWidgetFeature.DockWidgetClosable
+)
+
+# Toolbar groups and menus as (label, slot method name) entries; None is a separator.
+_TOOLBAR_GROUPS = (
+    (
+        "프로젝트",
+        (
+            ("프로젝트 열기...", "_open_project"),
+            ("분석", "_analyze_project"),
+            ("그래프 JSON 열기...", "_open_graph"),
+        ),
+    ),
+    ("보고서", (("유스케이스 종합 보고서", "_export_use_case_summary_report"),)),
+    ("탐색", (("화면 맞춤", "_zoom_to_fit"),)),
+)
+
+_MENU_SPEC = (
+    (
+        "분석",
+        (
+            ("아키텍처 규칙 검사 실행", "_run_rule_check"),
+            ("DDD 스멜 탐지 실행", "_run_smell_analysis"),
+            ("이벤트 드리븐 준비도", "_run_event_readiness"),
+        ),
+    ),
+    (
+        "보기",
+        (
+            ("헥사곤 뷰", "_show_hex_view"),
+            ("컨텍스트 맵", "_show_context_map"),
+            ("BC 필터 해제", "_clear_bc_filter"),
+            None,
+            ("다크 테마 전환", "_toggle_theme"),
+            ("레이아웃 초기화", "_setup_default_layout"),
+        ),
+    ),
+    (
+        "파일",
+        (
+            ("마이그레이션 계획 내보내기 (마크다운)...", "_export_migration_markdown"),
+            ("마이그레이션 계획 내보내기 (CSV)...", "_export_migration_csv"),
+            ("마이그레이션 계획 내보내기 (텍스트)...", "_export_migration_plain"),
+        ),
+    ),
+)
+
+_LAYER_SHORT_LABELS = {
+    "domain": "도메인",
+    "application": "앱",
+    "inbound_port": "인포트",
+    "outbound_port": "아웃포트",
+    "inbound_adapter": "인어댑터",
+    "outbound_adapter": "아웃어댑터",
+    "unknown": "미분류",
+}
+
+# Layer orders written into auto-generated target specs.
+_BC_EXPECTED_LAYERS = (
+    "domain",
+    "application",
+    "inbound_port",
+    "outbound_port",
+    "inbound_adapter",
+    "outbound_adapter",
+)
+_USE_CASE_EXPECTED_FLOW = (
+    "inbound_adapter",
+    "inbound_port",
+    "application",
+    "domain",
+    "outbound_port",
+    "outbound_adapter",
+)
+
+_FOCUS_OPACITY_LAYERS = (
+    "domain",
+    "application",
+    "inbound_port",
+    "outbound_port",
+    "inbound_adapter",
+    "outbound_adapter",
+    "unknown",
+    "adapter_zone",
+    "ports",
+)
+
+_FOCUS_TABLE = (
+    ("전체", "all", frozenset(), "전체 레이어"),
+    ("도메인만", "domain", frozenset({"domain"}), "도메인 포커스"),
+    ("애플리케이션만", "application", frozenset({"application"}), "애플리케이션 포커스"),
+    ("포트만", "ports", frozenset({"inbound_port", "outbound_port", "ports"}), "포트 포커스"),
+    (
+        "어댑터만",
+        "adapter",
+        frozenset({"inbound_adapter", "outbound_adapter", "adapter_zone"}),
+        "어댑터 포커스",
+    ),
+)
+
+_DARK_COLORS = {
+    "background": "#12161C",
+    "surface": "#1B222B",
+    "surface_alt": "#232C37",
+    "border": "#2B3642",
+    "text": "#E6EDF5",
+    "text_muted": "#A7B2C1",
+    "accent": "#4B7CFF",
+    "accent_soft": "#203358",
+    "grid": "#1F2731",
+    "grid_bold": "#2A3642",
+}
+
+_LIGHT_COLORS = {
+    "background": "#F2F4F6",
+    "surface": "#FFFFFF",
+    "surface_alt": "#F7F9FB",
+    "border": "#D5DADF",
+    "text": "#1F2937",
+    "text_muted": "#556070",
+    "accent": "#2156D8",
+    "accent_soft": "#E6EEFF",
+    "grid": "#E3E8EE",
+    "grid_bold": "#D3DAE3",
+}
+
+_TOOLBAR_STYLE_TEMPLATE = """
+    QToolBar {{
+        spacing: 10px;
+        padding: 8px;
+        background: {surface};
+        border-bottom: 1px solid {border};
+    }}
+    QLineEdit {{
+        padding: 7px 10px;
+        border-radius: 10px;
+        border: 1px solid {border};
+        background: {surface};
+        color: {text};
+    }}
+    QLineEdit:focus {{
+        border-color: {accent};
+    }}
+    QComboBox {{
+        padding: 7px 10px;
+        border-radius: 10px;
+        border: 1px solid {border};
+        background: {surface};
+        color: {text};
+    }}
+    QComboBox:focus {{
+        border-color: {accent};
+    }}
+    QToolButton {{
+        padding: 7px 12px;
+        border-radius: 10px;
+        background: {surface_alt};
+        color: {text};
+        border: 1px solid {border};
+    }}
+    QToolButton:hover {{
+        background: {accent_soft};
+        border-color: {accent};
+    }}
+    QLabel#toolbarGroupLabel {{
+        color: {text_muted};
+        font-size: 11px;
+        font-weight: 600;
+        padding: 0 4px;
+    }}
+    QLabel#toolbarStatusLabel {{
+        padding: 4px 10px;
+        border-radius: 10px;
+        background: {surface_alt};
+        color: {text};
+        font-weight: 600;
+    }}
+    QLabel#toolbarStatusLabel[tone="busy"] {{
+        background: {accent_soft};
+        color: {text};
+    }}
+    QLabel#toolbarStatusLabel[tone="success"] {{
+        background: {accent_soft};
+        color: {text};
+    }}
+    QLabel#toolbarStatusLabel[tone="idle"] {{
+        background: {surface_alt};
+        color: {text_muted};
+    }}
+    QToolButton#toolbarActionButton {{
+        padding: 6px 10px;
+        border-radius: 10px;
+        background: {surface};
+        color: {text};
+        border: 1px solid {border};
+    }}
+    QToolButton#toolbarActionButton:hover {{
+        background: {accent_soft};
+        border-color: {accent};
+    }}
+"""
+
+_WINDOW_STYLE_TEMPLATE = """
+    QMainWindow {{ background: {background}; }}
+    QDockWidget {{
+        background: {surface};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 10px;
+        titlebar-close-icon: url(none);
+    }}
+    QDockWidget::title {{
+        background: {surface};
+        padding: 10px 12px;
+        font-family: 'Gmarket Sans';
+        font-weight: 700;
+        border-bottom: 1px solid {border};
+    }}
+    QDockWidget QWidget {{
+        background: {surface};
+        color: {text};
+    }}
+    QScrollArea {{
+        border: none;
+        background: {surface};
+    }}
+    QGroupBox {{
+        border: 1px solid {border};
+        border-radius: 10px;
+        margin-top: 10px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 6px;
+        color: {text_muted};
+    }}
+    QMenuBar {{
+        background: {surface};
+        color: {text};
+    }}
+    QMenuBar::item:selected {{ background: {accent_soft}; }}
+    QMenu {{
+        background: {surface};
+        color: {text};
+        border: 1px solid {border};
+    }}
+    QMenu::item:selected {{ background: {accent_soft}; }}
+    QStatusBar {{
+        background: {surface};
+        color: {text_muted};
+    }}
+    QListWidget, QTableWidget, QTextEdit, QTreeWidget {{
+        background: {surface_alt};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 8px;
+    }}
+    QTableWidget {{
+        gridline-color: {border};
+        alternate-background-color: {surface};
+    }}
+    QTableWidget::item, QListWidget::item, QTreeWidget::item {{
+        padding: 6px 8px;
+    }}
+    QTableWidget::item:selected, QListWidget::item:selected, QTreeWidget::item:selected {{
+        background: {accent_soft};
+        color: {text};
+    }}
+    QHeaderView::section {{
+        background: {surface};
+        color: {text_muted};
+        border: 1px solid {border};
+        padding: 6px 8px;
+        font-weight: 600;
+    }}
+    QPushButton {{
+        background: {accent};
+        color: white;
+        border-radius: 8px;
+        padding: 7px 12px;
+        font-weight: 600;
+    }}
+    QPushButton:hover {{
+        background: {accent};
+        opacity: 0.9;
+    }}
+    QPushButton:disabled {{
+        background: {border};
+        color: {text_muted};
+    }}
+"""
+
+_TARGET_SETTINGS_TEMPLATE = '{{\n  "last_target_json_path": {path}\n}}'
+
+_SEVERITY_LABELS = {
+    "info": "정보",
+    "warning": "경고",
+    "error": "오류",
+}
+
+_SMELL_TYPE_LABELS = {
+    "anemic_domain": "빈약한 도메인",
+    "god_service": "갓 서비스",
+    "repository_leak": "레포지토리 누수",
+    "cross_aggregate_coupling": "크로스 애그리게잇",
+}
+
+_DEFAULT_SMELL_COLOR = QColor("#EF4444")
+
+# Shared read-only default for index lookups that miss.
+_EMPTY_TUPLE: tuple = ()
+
+# 컴포넌트가 이보다 많으면 항목별 dirty 영역 계산 대신 뷰포트 전체를 다시 그린다.
+_FULL_VIEWPORT_UPDATE_THRESHOLD = 500
+
+# 분석기가 읽는 소스 파일은 내용 해시로 비교해 touch만 된 경우 재분석하지 않는다.
+_WATCH_HASHED_SUFFIXES = frozenset({".java"})
+
+
+def _dir_entries(path: Path) -> set[str] | None:
+    try:
+        return {entry.name for entry in os.scandir(path)}
+    except OSError:
+        return None
+
+
+def _entry_exists(entries: set[str] | None, path: Path) -> bool:
+    return path.exists() if entries is None else path.name in entries
+
+
+def _watch_snapshot_changed(previous: dict, current: dict) -> bool:
+    if previous.keys() != current.keys():
+        return True
+    for key, (mtime, digest) in current.items():
+        before_mtime, before_digest = previous[key]
+        if mtime != before_mtime and (digest is None or digest != before_digest):
+            return True
+    return False
+
+
+def _index_smells(summary) -> tuple[defaultdict[str, list], defaultdict[str, list[str]]]:
+    index: defaultdict[str, list] = defaultdict(list)
+    display: defaultdict[str, list[str]] = defaultdict(list)
+    for smell in summary.smells:
+        index[smell.component_id].append(smell)
+        severity = smell.severity.value
+        smell_type = smell.smell_type.value
+        display[smell.component_id].append(
+            f"[{_SEVERITY_LABELS.get(severity, severity)}] "
+            f"{_SMELL_TYPE_LABELS.get(smell_type, smell_type)}: {smell.description}"
+        )
+    return index, display
+
+
+def _violation_label(violation) -> str:
+    severity = violation.severity
+    return f"[{_SEVERITY_LABELS.get(severity, severity)}] {violation.rule_id}: {violation.message}"
+
+
+def _same_inputs(current: tuple, previous: tuple | None) -> bool:
+    return previous is not None and all(a is b for a, b in zip(current, previous))
+
 
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
@@ -78,7 +451,8 @@ class MainWindow(QMainWindow):
         self.view_stack.addWidget(self.view)
         self.view_stack.addWidget(self.context_view)
         self.view.setRenderHint(QPainter.Antialiasing)
-        self.view.setViewportUpdateMode(self.view.ViewportUpdateMode.BoundingRectViewportUpdate)
+        if not self.view.opengl_viewport:
+            self.view.setViewportUpdateMode(self.view.ViewportUpdateMode.BoundingRectViewportUpdate)
         self.view.setBackgroundBrush(self._build_grid_brush(self._get_theme_colors()))
         self.view.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.view_stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -101,11 +475,42 @@ class MainWindow(QMainWindow):
         self.view.set_minimap(self.minimap)
         self.view.viewport_changed.connect(self.minimap.schedule_viewport_update)
         self.scene.changed.connect(self.minimap.schedule_refresh)
+        self.scene.component_clicked.connect(self._on_component_clicked)
+        self.scene.component_hovered.connect(self._on_component_hovered)
+        self.scene.component_double_clicked.connect(self._open_component_path)
+        self.scene.component_moved.connect(self._invalidate_graph_bounds)
 
         self.inspector = InspectorPanel()
+        self.inspector.flow_button.clicked.connect(self._show_flow_from_inspector)
+        self.inspector.clear_flow_button.clicked.connect(self._clear_flow)
+        self.inspector.flow_list.itemClicked.connect(self._on_flow_item_clicked)
+        self.inspector.animate_flow_button.clicked.connect(self._play_flow_animation)
+        self.inspector.flow_speed.currentTextChanged.connect(self._update_flow_speed)
+        self.inspector.violations_list.itemClicked.connect(self._on_component_violation_clicked)
+        self.inspector.smells_list.itemClicked.connect(self._on_component_smell_clicked)
+        self.inspector.report_button.clicked.connect(self._show_use_case_report_for_selection)
         self.search_matches: list[str] = []
         self.search_index = 0
+        self._search_ids: list[str] = []
+        # 소문자 "이름\x1f패키지" — 구분자는 입력될 수 없어 두 필드를 잇는 매칭이 생기지 않는다.
+        self._search_haystacks: list[str] = []
+        self._search_query = ""
+        self._search_rows: list[int] = []
+        self._pending_query = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(130)
+        self._search_timer.timeout.connect(self._run_search)
         self._last_hovered_id: str | None = None
+        self._pending_hover: tuple[object, bool] | None = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(40)
+        self._hover_timer.timeout.connect(self._flush_hover)
+        self._status_warning_timer = QTimer(self)
+        self._status_warning_timer.setSingleShot(True)
+        self._status_warning_timer.setInterval(3000)
+        self._status_warning_timer.timeout.connect(lambda: self.statusBar().setStyleSheet(""))
         self._inspector_dock: QDockWidget | None = None
         self._rules_dock: QDockWidget | None = None
         self._report_dock: QDockWidget | None = None
@@ -114,41 +519,73 @@ class MainWindow(QMainWindow):
         self._context_dock: QDockWidget | None = None
         self._left_dock: QDockWidget | None = None
         self._migration_dock: QDockWidget | None = None
+        self.rules_panel: ArchitectureRulesPanel | None = None
+        self.report_panel: UseCaseReportPanel | None = None
+        self.smells_panel: SmellsPanel | None = None
+        self.readiness_panel: EventReadinessPanel | None = None
+        self.context_panel: ContextMapInfoPanel | None = None
+        self.migration_panel: MigrationPlannerPanel | None = None
+        self._header_status: QLabel | None = None
+        self._header_actions_container: QWidget | None = None
+        self._header_actions_layout: QHBoxLayout | None = None
+        self._summary_report_action: QAction | None = None
+        self._actions: dict[str, QAction] = {}
+        self._last_focus_layers: frozenset[str] | None = None
+        self._focus_ids_cache: tuple[list[str], frozenset[str]] | None = None
+        self._toolbars: list[QToolBar] = []
         self._init_actions()
         self._init_docks()
         self._current_graph = None
+        self._graph_bounds_cache = None
         self._flow_animation: FlowAnimationController | None = None
         self._last_flow_nodes: list = []
-        self._violations_by_component: dict[str, list] = {}
+        self._flow_cache: dict[str, FlowResult] = {}
+        self._violations_by_component: defaultdict[str, list] = defaultdict(list)
+        self._violation_display_by_component: defaultdict[str, list[str]] = defaultdict(list)
         self._violations: list = []
+        self._rules_summary: RuleAnalysisSummary | None = None
         self._event_readiness = None
         self._smell_summary = None
         self._smells_by_component: dict[str, list] = {}
+        self._smell_display_by_component: dict[str, list[str]] = {}
         self._bc_analysis: BoundedContextAnalysisResult | None = None
+        self._analysis_cache: dict[str, object] = {}
         self._component_to_bc: dict[str, str] = {}
+        self._components_by_id: dict[str, object] = {}
+        self._use_case_entry_ids: frozenset[str] = frozenset()
         self._use_case_reports: UseCaseReportSet | None = None
         self._building_reports = False
+        self._reports_dirty = False
+        self._reports_inputs: tuple | None = None
+        self._batch_mode = False
         self._target_spec: TargetArchitectureSpec | None = None
+        self._saved_target_settings: tuple[Path, str] | None = None
         self._migration_plan = None
+        self._migration_inputs: tuple | None = None
         self._pending_focus_component_id: str | None = None
         self._suppress_report_focus = False
         self._rules_done = False
         self._smells_done = False
         self._readiness_done = False
-        self._header_status: QLabel | None = None
-        self._header_actions_container: QWidget | None = None
-        self._header_actions_layout: QHBoxLayout | None = None
-        self._summary_report_action: QAction | None = None
         self._watch_timer: QTimer | None = None
-        self._watch_snapshot: dict[str, float] = {}
+        self._watch_snapshot: dict[str, tuple[float, bytes | None]] = {}
         self._watch_root: Path | None = None
         self._watch_in_progress = False
+        self._watch_rerun = False
+        self._pending_watch_root: Path | None = None
+        self._watch_debounce_timer = QTimer(self)
+        self._watch_debounce_timer.setSingleShot(True)
+        self._watch_debounce_timer.setInterval(300)
+        self._watch_debounce_timer.timeout.connect(self._run_watch_analysis)
+        self._analysis_worker: AnalysisWorker | None = None
+        self._export_workers: dict[str, ExportWorker] = {}
         self._apply_theme()
 
     def _init_actions(self) -> None:
         toolbar = QToolBar("메인")
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
+        self._toolbars.append(toolbar)
 
         def add_group_label(text: str) -> None:
             label = QLabel(text)
@@ -156,31 +593,13 @@ class MainWindow(QMainWindow):
             label.setContentsMargins(6, 0, 6, 0)
             toolbar.addWidget(label)
 
-        add_group_label("프로젝트")
-        open_project_action = QAction("프로젝트 열기...", self)
-        open_project_action.triggered.connect(self._open_project)
-        toolbar.addAction(open_project_action)
-
-        analyze_action = QAction("분석", self)
-        analyze_action.triggered.connect(self._analyze_project)
-        toolbar.addAction(analyze_action)
-
-        open_graph_action = QAction("그래프 JSON 열기...", self)
-        open_graph_action.triggered.connect(self._open_graph)
-        toolbar.addAction(open_graph_action)
-
-        toolbar.addSeparator()
-        add_group_label("보고서")
-        self._summary_report_action = QAction("유스케이스 종합 보고서", self)
+        for index, (group, spec) in enumerate(_TOOLBAR_GROUPS):
+            if index:
+                toolbar.addSeparator()
+            add_group_label(group)
+            self._add_actions(toolbar, spec)
+        self._summary_report_action = self._actions["_export_use_case_summary_report"]
         self._summary_report_action.setEnabled(False)
-        self._summary_report_action.triggered.connect(self._export_use_case_summary_report)
-        toolbar.addAction(self._summary_report_action)
-
-        toolbar.addSeparator()
-        add_group_label("탐색")
-        zoom_fit_action = QAction("화면 맞춤", self)
-        zoom_fit_action.triggered.connect(self._zoom_to_fit)
-        toolbar.addAction(zoom_fit_action)
 
         search_label = QLabel("검색")
         search_label.setContentsMargins(12, 0, 4, 0)
@@ -188,25 +607,16 @@ class MainWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("클래스/패키지 검색")
         self.search_input.setFixedWidth(240)
-        self.search_input.textChanged.connect(self._update_search_matches)
+        self.search_input.textChanged.connect(self._on_search_text_changed)
         self.search_input.returnPressed.connect(self._find_next_match)
         toolbar.addWidget(self.search_input)
-        search_action = QAction("찾기", self)
-        search_action.triggered.connect(self._find_next_match)
-        toolbar.addAction(search_action)
+        self._add_actions(toolbar, (("찾기", "_find_next_match"),))
 
         focus_label = QLabel("포커스")
         focus_label.setContentsMargins(12, 0, 4, 0)
         toolbar.addWidget(focus_label)
         self.focus_box = QComboBox()
-        focus_options = [
-            ("전체", "all"),
-            ("도메인만", "domain"),
-            ("애플리케이션만", "application"),
-            ("포트만", "ports"),
-            ("어댑터만", "adapter"),
-        ]
-        for label, value in focus_options:
+        for label, value, _, _ in _FOCUS_TABLE:
             self.focus_box.addItem(label, value)
         self.focus_box.currentIndexChanged.connect(self._apply_layer_focus)
         toolbar.addWidget(self.focus_box)
@@ -224,47 +634,60 @@ class MainWindow(QMainWindow):
         filter_dock = QDockWidget("범례/필터", self)
         filter_dock.setWidget(left_sidebar)
         filter_dock.setAllowedAreas(Qt.DockWidgetArea.LeftDockWidgetArea)
-        filter_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
+        filter_dock.setFeatures(_DOCK_FEATURES)
         filter_dock.setMinimumWidth(220)
         left_sidebar.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         self.addDockWidget(Qt.LeftDockWidgetArea, filter_dock)
         self._left_dock = filter_dock
 
-        inspector_dock = QDockWidget("인스펙터", self)
-        inspector_dock.setWidget(self._wrap_scroll(self.inspector))
-        inspector_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        inspector_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
-        inspector_dock.setMinimumWidth(320)
-        inspector_dock.setMaximumWidth(420)
-        inspector_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.inspector.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, inspector_dock)
-        self._inspector_dock = inspector_dock
+        self._inspector_dock = self._make_right_dock("인스펙터", self.inspector)
 
+        self._dock_factories = {
+            "rules": self._build_rules_dock,
+            "report": self._build_report_dock,
+            "smells": self._build_smells_dock,
+            "readiness": self._build_readiness_dock,
+            "context": self._build_context_dock,
+            "migration": self._build_migration_dock,
+        }
+        self.context_scene.bc_selected.connect(self._on_bc_selected)
+
+        self._setup_default_layout()
+
+    def _ensure_docks(self, *keys: str) -> None:
+        for key in keys or tuple(self._dock_factories):
+            factory = self._dock_factories.pop(key, None)
+            if factory:
+                factory()
+
+    def _make_right_dock(
+        self, title: str, panel: QWidget, min_height: int | None = None
+    ) -> QDockWidget:
+        dock = QDockWidget(title, self)
+        # Panels that scroll on their own, or are small enough to fit, are docked without the wrapper.
+        if getattr(panel, "SKIP_DOCK_SCROLL_WRAPPER", False):
+            dock.setWidget(panel)
+        else:
+            dock.setWidget(self._wrap_scroll(panel))
+        dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
+        dock.setFeatures(_DOCK_FEATURES)
+        dock.setMinimumWidth(320)
+        dock.setMaximumWidth(420)
+        if min_height is not None:
+            dock.setMinimumHeight(min_height)
+        dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
+        panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self.addDockWidget(Qt.RightDockWidgetArea, dock)
+        if self._inspector_dock:
+            self.tabifyDockWidget(self._inspector_dock, dock)
+        return dock
+
+    def _build_rules_dock(self) -> None:
         self.rules_panel = ArchitectureRulesPanel()
         self.rules_panel.violation_selected.connect(self._on_rule_violation_selected)
-        rules_dock = QDockWidget("아키텍처 규칙", self)
-        rules_dock.setWidget(self._wrap_scroll(self.rules_panel))
-        rules_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        rules_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
-        rules_dock.setMinimumWidth(320)
-        rules_dock.setMaximumWidth(420)
-        rules_dock.setMinimumHeight(260)
-        rules_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.rules_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, rules_dock)
-        self.tabifyDockWidget(inspector_dock, rules_dock)
-        self._rules_dock = rules_dock
+        self._rules_dock = self._make_right_dock("아키텍처 규칙", self.rules_panel, min_height=260)
 
+    def _build_report_dock(self) -> None:
         self.report_panel = UseCaseReportPanel()
         if hasattr(self, "_on_use_case_step_selected"):
             self.report_panel.step_selected.connect(self._on_use_case_step_selected)
@@ -273,76 +696,25 @@ class MainWindow(QMainWindow):
         self.report_panel.use_case_box.currentIndexChanged.connect(
             self._on_report_use_case_changed
         )
-        report_dock = QDockWidget("유스케이스 리포트", self)
-        report_dock.setWidget(self._wrap_scroll(self.report_panel))
-        report_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        report_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
-        report_dock.setMinimumWidth(320)
-        report_dock.setMaximumWidth(420)
-        report_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.report_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, report_dock)
-        self.tabifyDockWidget(inspector_dock, report_dock)
-        self._report_dock = report_dock
+        self._report_dock = self._make_right_dock("유스케이스 리포트", self.report_panel)
 
+    def _build_smells_dock(self) -> None:
         self.smells_panel = SmellsPanel()
         self.smells_panel.smell_selected.connect(self._on_smell_selected)
-        smells_dock = QDockWidget("DDD 스멜", self)
-        smells_dock.setWidget(self._wrap_scroll(self.smells_panel))
-        smells_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        smells_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
-        smells_dock.setMinimumWidth(320)
-        smells_dock.setMaximumWidth(420)
-        smells_dock.setMinimumHeight(260)
-        smells_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.smells_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, smells_dock)
-        self.tabifyDockWidget(inspector_dock, smells_dock)
-        self._smells_dock = smells_dock
+        self._smells_dock = self._make_right_dock("DDD 스멜", self.smells_panel, min_height=260)
 
+    def _build_readiness_dock(self) -> None:
         self.readiness_panel = EventReadinessPanel()
         self.readiness_panel.use_case_selected.connect(self._on_readiness_use_case_selected)
-        readiness_dock = QDockWidget("이벤트 드리븐 준비도", self)
-        readiness_dock.setWidget(self._wrap_scroll(self.readiness_panel))
-        readiness_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        readiness_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
+        self._readiness_dock = self._make_right_dock(
+            "이벤트 드리븐 준비도", self.readiness_panel, min_height=260
         )
-        readiness_dock.setMinimumWidth(320)
-        readiness_dock.setMaximumWidth(420)
-        readiness_dock.setMinimumHeight(260)
-        readiness_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.readiness_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, readiness_dock)
-        self.tabifyDockWidget(inspector_dock, readiness_dock)
-        self._readiness_dock = readiness_dock
 
+    def _build_context_dock(self) -> None:
         self.context_panel = ContextMapInfoPanel()
-        context_dock = QDockWidget("컨텍스트 맵 정보", self)
-        context_dock.setWidget(self._wrap_scroll(self.context_panel))
-        context_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        context_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
-        )
-        context_dock.setMinimumWidth(320)
-        context_dock.setMaximumWidth(420)
-        context_dock.setMinimumHeight(240)
-        context_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.context_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, context_dock)
-        self.tabifyDockWidget(inspector_dock, context_dock)
-        self._context_dock = context_dock
-
-        self.context_scene.bc_selected.connect(self._on_bc_selected)
+        self._context_dock = self._make_right_dock("컨텍스트 맵 정보", self.context_panel, min_height=240)
 
+    def _build_migration_dock(self) -> None:
         self.migration_panel = MigrationPlannerPanel()
         self.migration_panel.override_target_requested.connect(self._load_target_spec_override)
         self.migration_panel.refresh_requested.connect(self._rebuild_migration_plan)
@@ -352,64 +724,24 @@ class MainWindow(QMainWindow):
         self.migration_panel.export_csv_requested.connect(self._export_migration_csv)
         self.migration_panel.export_plain_requested.connect(self._export_migration_plain)
         self.migration_panel.item_selected.connect(self._on_migration_item_selected)
-        migration_dock = QDockWidget("마이그레이션 플래너", self)
-        migration_dock.setWidget(self._wrap_scroll(self.migration_panel))
-        migration_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        migration_dock.setFeatures(
-            QDockWidget.DockWidgetFeature.DockWidgetMovable
-            | QDockWidget.DockWidgetFeature.DockWidgetClosable
+        self._migration_dock = self._make_right_dock(
+            "마이그레이션 플래너", self.migration_panel, min_height=280
         )
-        migration_dock.setMinimumWidth(320)
-        migration_dock.setMaximumWidth(420)
-        migration_dock.setMinimumHeight(280)
-        migration_dock.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        self.migration_panel.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        self.addDockWidget(Qt.RightDockWidgetArea, migration_dock)
-        self.tabifyDockWidget(inspector_dock, migration_dock)
-        self._migration_dock = migration_dock
-
-        self._setup_default_layout()
 
     def _init_menu(self) -> None:
-        analyze_menu = self.menuBar().addMenu("분석")
-        run_rules_action = QAction("아키텍처 규칙 검사 실행", self)
-        run_rules_action.triggered.connect(self._run_rule_check)
-        analyze_menu.addAction(run_rules_action)
-        run_smells_action = QAction("DDD 스멜 탐지 실행", self)
-        run_smells_action.triggered.connect(self._run_smell_analysis)
-        analyze_menu.addAction(run_smells_action)
-        readiness_action = QAction("이벤트 드리븐 준비도", self)
-        readiness_action.triggered.connect(self._run_event_readiness)
-        analyze_menu.addAction(readiness_action)
-
-        view_menu = self.menuBar().addMenu("보기")
-        hex_view_action = QAction("헥사곤 뷰", self)
-        hex_view_action.triggered.connect(self._show_hex_view)
-        context_map_action = QAction("컨텍스트 맵", self)
-        context_map_action.triggered.connect(self._show_context_map)
-        clear_bc_action = QAction("BC 필터 해제", self)
-        clear_bc_action.triggered.connect(self._clear_bc_filter)
-        view_menu.addAction(hex_view_action)
-        view_menu.addAction(context_map_action)
-        view_menu.addAction(clear_bc_action)
-        view_menu.addSeparator()
-        toggle_theme_action = QAction("다크 테마 전환", self)
-        toggle_theme_action.triggered.connect(self._toggle_theme)
-        view_menu.addAction(toggle_theme_action)
-        reset_layout_action = QAction("레이아웃 초기화", self)
-        reset_layout_action.triggered.connect(self._setup_default_layout)
-        view_menu.addAction(reset_layout_action)
-
-        file_menu = self.menuBar().addMenu("파일")
-        export_md_action = QAction("마이그레이션 계획 내보내기 (마크다운)...", self)
-        export_md_action.triggered.connect(self._export_migration_markdown)
-        export_csv_action = QAction("마이그레이션 계획 내보내기 (CSV)...", self)
-        export_csv_action.triggered.connect(self._export_migration_csv)
-        export_plain_action = QAction("마이그레이션 계획 내보내기 (텍스트)...", self)
-        export_plain_action.triggered.connect(self._export_migration_plain)
-        file_menu.addAction(export_md_action)
-        file_menu.addAction(export_csv_action)
-        file_menu.addAction(export_plain_action)
+        for title, spec in _MENU_SPEC:
+            self._add_actions(self.menuBar().addMenu(title), spec)
+
+    def _add_actions(self, target, spec) -> None:
+        for entry in spec:
+            if entry is None:
+                target.addSeparator()
+                continue
+            label, slot_name = entry
+            action = QAction(label, self)
+            action.triggered.connect(getattr(self, slot_name))
+            target.addAction(action)
+            self._actions[slot_name] = action
 
     def _init_header_status(self, toolbar: QToolBar) -> None:
         status_container = QWidget()
@@ -465,23 +797,61 @@ class MainWindow(QMainWindow):
 
     def _analyze_project(self) -> None:
         if not self.project_root:
-            QMessageBox.warning(self, "프로젝트 필요", "먼저 프로젝트를 선택하세요.")
+            self._show_status_warning("먼저 프로젝트를 선택하세요.")
+            return
+        if not self._start_analysis(self.project_root):
+            self.statusBar().showMessage("이미 분석이 진행 중입니다.", 2000)
             return
-        output_path = self.project_root / "architecture.json"
         self.statusBar().showMessage("분석 중...", 0)
         self._set_header_status("분석 실행 중", "busy")
         self._reset_header_actions()
         self._rules_done = False
         self._smells_done = False
         self._readiness_done = False
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        try:
-            graph = analyze_project(self.project_root, output_path)
-        finally:
-            QApplication.restoreOverrideCursor()
-        self._load_graph(graph)
-        self.statusBar().showMessage("분석 완료", 2000)
+
+    def _show_status_warning(self, message: str) -> None:
+        status = self.statusBar()
+        status.setStyleSheet("color: #B91C1C;")
+        status.showMessage(message, self._status_warning_timer.interval())
+        self._status_warning_timer.start()
+
+    def _start_analysis(self, project_root: Path, graph_path: Path | None = None) -> bool:
+        if self._analysis_worker:
+            return False
+        if graph_path:
+            worker = AnalysisWorker(project_root, graph_path=graph_path)
+        else:
+            worker = AnalysisWorker(project_root, project_root / "architecture.json")
+        worker.signals.finished.connect(self._on_analysis_finished)
+        worker.signals.failed.connect(self._on_analysis_failed)
+        self._analysis_worker = worker
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _on_analysis_finished(self, result: AnalysisResult) -> None:
+        self._analysis_worker = None
+        self._load_graph(result)
+        if self._watch_in_progress:
+            self._set_header_status("재분석 완료", "success")
+            self._watch_in_progress = False
+        else:
+            self.statusBar().showMessage(
+                "그래프 로딩 완료" if result.graph_path else "분석 완료", 2000
+            )
+            self._update_header_status()
+        self._resume_pending_watch()
+
+    def _on_analysis_failed(self, message: str) -> None:
+        self._analysis_worker = None
+        watch_run = self._watch_in_progress
+        self._watch_in_progress = False
+        self._resume_pending_watch()
         self._update_header_status()
+        if watch_run:
+            # 저장할 때마다 대화상자가 뜨지 않도록 감시 재분석 실패는 상태 표시줄에만 알린다.
+            self._show_status_warning(f"재분석 실패: {message}")
+            return
+        QMessageBox.warning(self, "분석 실패", message)
 
     def _open_graph(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(
@@ -489,38 +859,62 @@ class MainWindow(QMainWindow):
         )
         if not file_path:
             return
+        self.open_graph_file(Path(file_path))
+
+    def open_graph_file(
+        self, path: Path, project_root: Path | None = None, watch: bool = False
+    ) -> bool:
+        project_root = project_root or path.parent
+        if not self._start_analysis(project_root, graph_path=path):
+            self.statusBar().showMessage("이미 분석이 진행 중입니다.", 2000)
+            return False
+        if watch:
+            # 첫 로딩이 끝난 뒤에 기준 스냅샷을 잡도록 감시 시작을 미룬다.
+            self._pending_watch_root = project_root
         self.statusBar().showMessage("그래프 불러오는 중...", 0)
         self._set_header_status("그래프 불러오는 중", "busy")
         self._reset_header_actions()
-        path = Path(file_path)
-        self.project_root = path.parent
+        self.project_root = project_root
         self.inspector.set_base_path(self.project_root)
-        graph = load_graph(path)
-        self._load_graph(graph)
-        self.statusBar().showMessage("그래프 로딩 완료", 2000)
-        self._update_header_status()
+        return True
 
-    def _load_graph(self, graph) -> None:
-        self.scene.load_graph(graph)
+    def _load_graph(self, analysis: AnalysisResult) -> None:
+        graph = analysis.graph
+        self._ensure_docks()
+        self._hover_timer.stop()
+        self._pending_hover = None
         self._current_graph = graph
-        for item in self.scene.component_items.values():
-            item.clicked.connect(self._on_component_clicked)
-            item.hovered.connect(self._on_component_hovered)
-            item.double_clicked.connect(self._open_component_path)
-        self._update_layer_filters()
-        self._apply_layer_focus()
-        self.inspector.flow_button.clicked.connect(self._show_flow_from_inspector)
-        self.inspector.clear_flow_button.clicked.connect(self._clear_flow)
-        self.inspector.flow_list.itemClicked.connect(self._on_flow_item_clicked)
-        self.inspector.animate_flow_button.clicked.connect(self._play_flow_animation)
-        self.inspector.flow_speed.currentTextChanged.connect(self._update_flow_speed)
-        self.inspector.violations_list.itemClicked.connect(self._on_component_violation_clicked)
-        self.inspector.smells_list.itemClicked.connect(self._on_component_smell_clicked)
-        self.inspector.report_button.clicked.connect(self._show_use_case_report_for_selection)
-        self._run_rule_check()
-        self._run_smell_analysis()
-        self._run_bounded_context_analysis()
-        self._build_use_case_reports()
+        self._reset_analysis_cache(analysis)
+        self._graph_bounds_cache = None
+        self._flow_cache = {}
+        self._last_focus_layers = None
+        self._violations = []
+        self._rules_summary = None
+        self._violations_by_component = defaultdict(list)
+        self._violation_display_by_component = defaultdict(list)
+        self._event_readiness = analysis.event_readiness
+        self._components_by_id = {component.id: component for component in graph.components}
+        self._use_case_entry_ids = frozenset(
+            component.id for component in graph.components if is_use_case_entry(component)
+        )
+        self.view.setUpdatesEnabled(False)
+        try:
+            self.scene.load_graph(graph)
+            self._apply_viewport_update_mode()
+            self._rebuild_search_index()
+            self._update_layer_filters()
+            self._apply_layer_focus()
+        finally:
+            self.view.setUpdatesEnabled(True)
+        self._batch_mode = True
+        try:
+            self._apply_rule_results(analysis.violations, analysis.rule_summary)
+            self._apply_smell_summary(analysis.smell_summary)
+            self._apply_bc_analysis(analysis.bc_analysis)
+        finally:
+            self._batch_mode = False
+        self._reports_dirty = False
+        self._set_use_case_reports(analysis.use_case_reports)
         self._auto_load_or_create_target_spec()
         self._setup_default_layout()
         if self.statusBar().currentMessage() != "그래프 로딩 완료":
@@ -529,47 +923,67 @@ class MainWindow(QMainWindow):
         if self._summary_report_action:
             self._summary_report_action.setEnabled(True)
 
+    def _apply_viewport_update_mode(self) -> None:
+        modes = self.view.ViewportUpdateMode
+        if (
+            self.view.opengl_viewport
+            or len(self.scene.component_items) > _FULL_VIEWPORT_UPDATE_THRESHOLD
+        ):
+            mode = modes.FullViewportUpdate
+        else:
+            mode = modes.BoundingRectViewportUpdate
+        self.view.setViewportUpdateMode(mode)
+        self.minimap.setViewportUpdateMode(mode)
+
+    def _reset_analysis_cache(self, analysis: AnalysisResult) -> None:
+        # 메뉴에서 분석을 다시 실행할 때 현재 그래프의 결과를 재사용한다.
+        self._analysis_cache = {
+            "rules": (analysis.violations, analysis.rule_summary),
+            "smells": analysis.smell_summary,
+            "readiness": analysis.event_readiness,
+            "bc": analysis.bc_analysis,
+        }
+
+    def _cached_analysis(self, name: str, compute):
+        cache = self._analysis_cache
+        if name not in cache:
+            cache[name] = compute()
+        return cache[name]
+
     def _update_layer_filters(self) -> None:
+        set_visible = self.scene.set_layer_visible
         for layer, box in self.filter_boxes.items():
-            self.scene.set_layer_visible(layer, box.isChecked())
-        self.scene.set_layer_visible("adapter_zone", True)
+            set_visible(layer, box.isChecked())
+        set_visible("adapter_zone", True)
         inbound_port_box = self.filter_boxes.get("inbound_port")
         outbound_port_box = self.filter_boxes.get("outbound_port")
         ports_visible = (
             bool(inbound_port_box and inbound_port_box.isChecked())
             or bool(outbound_port_box and outbound_port_box.isChecked())
         )
-        self.scene.set_layer_visible("ports", bool(ports_visible))
+        set_visible("ports", bool(ports_visible))
         self._restore_focus_after_filter_change()
 
     def _apply_layer_focus(self) -> None:
-        focus = self.focus_box.currentData() or "all"
-        if focus == "all":
-            self._set_focus_opacity({})
-            self.statusBar().showMessage("전체 레이어", 1500)
-            return
-
-        if focus == "domain":
-            self._set_focus_opacity({"domain"})
-            self.statusBar().showMessage("도메인 포커스", 1500)
-        elif focus == "application":
-            self._set_focus_opacity({"application"})
-            self.statusBar().showMessage("애플리케이션 포커스", 1500)
-        elif focus == "ports":
-            self._set_focus_opacity({"inbound_port", "outbound_port", "ports"})
-            self.statusBar().showMessage("포트 포커스", 1500)
-        elif focus == "adapter":
-            self._set_focus_opacity({"inbound_adapter", "outbound_adapter", "adapter_zone"})
-            self.statusBar().showMessage("어댑터 포커스", 1500)
+        index = self.focus_box.currentIndex()
+        if index < 0 or index >= len(_FOCUS_TABLE):
+            return
+        _, _, focus_layers, message = _FOCUS_TABLE[index]
+        self._set_focus_opacity(focus_layers)
+        self.statusBar().showMessage(message, 1500)
 
     def _zoom_to_fit(self) -> None:
-        rect = self.scene.graph_bounds()
-        self.view.zoom_to_fit(rect)
+        if self._graph_bounds_cache is None:
+            self._graph_bounds_cache = self.scene.graph_bounds()
+        self.view.zoom_to_fit(self._graph_bounds_cache)
+
+    def _invalidate_graph_bounds(self) -> None:
+        self._graph_bounds_cache = None
 
     def _open_component_path(self, component) -> None:
         if not component.path:
             return
-        if is_use_case_entry(component) and self._use_case_reports:
+        if component.id in self._use_case_entry_ids and self._use_case_reports:
             self.report_panel.select_use_case(component.id)
             if self._report_dock:
                 self._report_dock.raise_()
@@ -580,11 +994,12 @@ class MainWindow(QMainWindow):
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(path.resolve())))
 
     def _on_component_clicked(self, component) -> None:
-        self.inspector.show_component(component)
+        if self.inspector.current_component() is not component:
+            self.inspector.show_component(component)
         self.scene.set_active_component(component.id)
         self._show_component_violations(component.id)
         self._show_component_smells(component.id)
-        self.inspector.report_button.setEnabled(is_use_case_entry(component))
+        self.inspector.report_button.setEnabled(component.id in self._use_case_entry_ids)
         if self._inspector_dock:
             self._inspector_dock.raise_()
         bc_id = self._component_to_bc.get(component.id)
@@ -593,26 +1008,35 @@ class MainWindow(QMainWindow):
             context = self._bc_analysis.contexts.get(bc_id)
             if context:
                 self.context_panel.show_context(context)
-        if is_use_case_entry(component) and self._use_case_reports:
+        if component.id in self._use_case_entry_ids and self._use_case_reports:
             self.report_panel.select_use_case(component.id)
 
     def _on_component_hovered(self, component, hovered: bool) -> None:
+        self._pending_hover = (component, hovered)
+        self._hover_timer.start()
+
+    def _flush_hover(self) -> None:
+        if not self._pending_hover:
+            return
+        component, hovered = self._pending_hover
+        self._pending_hover = None
         if hovered:
             self._last_hovered_id = component.id
-            self.inspector.show_component(component)
-            self.inspector.report_button.setEnabled(is_use_case_entry(component))
-            self._show_component_smells(component.id)
+            self._show_hovered_component(component)
         else:
             if self._last_hovered_id == component.id:
                 self._last_hovered_id = None
             if self.scene.active_component_id:
                 active = self.scene.component_items.get(self.scene.active_component_id)
                 if active:
-                    self.inspector.show_component(active.component)
-                    self.inspector.report_button.setEnabled(
-                        is_use_case_entry(active.component)
-                    )
-                    self._show_component_smells(active.component.id)
+                    self._show_hovered_component(active.component)
+
+    def _show_hovered_component(self, component) -> None:
+        if self.inspector.current_component() is component:
+            return
+        self.inspector.show_component(component)
+        self.inspector.report_button.setEnabled(component.id in self._use_case_entry_ids)
+        self._show_component_smells(component.id)
 
     def _generate_use_case_report(self) -> None:
         return
@@ -621,8 +1045,7 @@ class MainWindow(QMainWindow):
         component = self.inspector.current_component()
         if not component:
             return
-        if not self._use_case_reports:
-            self._build_use_case_reports()
+        self._ensure_use_case_reports()
         if not self._use_case_reports:
             return
         self.report_panel.select_use_case(component.id)
@@ -672,6 +1095,7 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("유스케이스 종합 보고서를 저장했습니다.", 2000)
 
     def _build_use_case_summary_markdown(self) -> str:
+        self._flush_use_case_reports()
         if not self._use_case_reports:
             return "# 유스케이스 종합 보고서\n\n분석 결과가 없습니다."
 
@@ -797,56 +1221,99 @@ class MainWindow(QMainWindow):
         if not self._current_graph:
             return
         self._set_header_status("규칙 분석 중", "busy")
-        violations, summary = run_rule_analysis(self._current_graph)
-        self._violations = violations
+        violations, summary = self._cached_analysis(
+            "rules", lambda: run_rule_analysis(self._current_graph)
+        )
+        self._apply_rule_results(violations, summary)
+
+    def _apply_rule_results(self, violations: list, summary: RuleAnalysisSummary) -> None:
+        self._rules_summary = summary
+        if self._index_violations(violations):
+            self._violations = violations
+            self.scene.apply_rule_violations(violations)
         self.rules_panel.show_results(summary, violations)
-        self._violations_by_component = {}
-        for violation in violations:
-            self._violations_by_component.setdefault(violation.source_component_id, []).append(
-                violation
-            )
-            if violation.target_component_id:
-                self._violations_by_component.setdefault(violation.target_component_id, []).append(
-                    violation
-                )
-        self.scene.apply_rule_violations(violations)
         if self.scene.active_component_id:
             self._show_component_violations(self.scene.active_component_id)
-        self._build_use_case_reports()
+        self._schedule_use_case_reports()
         self._rules_done = True
         self._update_header_status()
 
+    def _index_violations(self, violations: list) -> bool:
+        if violations is self._violations or violations == self._violations:
+            return False
+        index = index_violations_by_component(violations)
+        self._violations_by_component = index
+        self._violation_display_by_component = defaultdict(
+            list,
+            {
+                component_id: [_violation_label(violation) for violation in bucket]
+                for component_id, bucket in index.items()
+            },
+        )
+        return True
+
     def _run_smell_analysis(self) -> None:
         if not self._current_graph:
             return
         self._set_header_status("스멜 분석 중", "busy")
-        components = {component.id: component for component in self._current_graph.components}
-        metrics = ComponentMetricsProvider(components)
-        summary = analyze_project_smells(self._current_graph, metrics)
-        self._smell_summary = summary
+        metrics = ComponentMetricsProvider(self._components_by_id)
+        self._apply_smell_summary(
+            self._cached_analysis(
+                "smells", lambda: analyze_project_smells(self._current_graph, metrics)
+            )
+        )
+
+    def _apply_smell_summary(self, summary) -> None:
+        if summary is not self._smell_summary:
+            self._smell_summary = summary
+            self._smells_by_component, self._smell_display_by_component = self._cached_analysis(
+                "smells_index", lambda: _index_smells(summary)
+            )
         self.smells_panel.show_results(summary)
-        self._smells_by_component = {}
-        for smell in summary.smells:
-            self._smells_by_component.setdefault(smell.component_id, []).append(smell)
         if self.scene.active_component_id:
             self._show_component_smells(self.scene.active_component_id)
-        self._build_use_case_reports()
+        self._schedule_use_case_reports()
         self._smells_done = True
         self._update_header_status()
 
     def _run_bounded_context_analysis(self) -> None:
         if not self._current_graph:
             return
-        self._bc_analysis = analyze_bounded_contexts(self._current_graph)
+        self._apply_bc_analysis(
+            self._cached_analysis("bc", lambda: analyze_bounded_contexts(self._current_graph))
+        )
+
+    def _apply_bc_analysis(self, analysis: BoundedContextAnalysisResult) -> None:
+        self._bc_analysis = analysis
         self.context_scene.load_analysis(self._bc_analysis)
-        self._component_to_bc = {}
-        for bc in self._bc_analysis.contexts.values():
-            for component_id in bc.component_ids:
-                self._component_to_bc[component_id] = bc.id
+        self._component_to_bc = {
+            component_id: bc.id
+            for bc in analysis.contexts.values()
+            for component_id in bc.component_ids
+        }
+        self._schedule_use_case_reports()
+
+    def _schedule_use_case_reports(self) -> None:
+        # 분석 결과가 연달아 들어와도 이벤트 루프 한 턴에 한 번만 다시 만든다.
+        if self._batch_mode or self._reports_dirty:
+            return
+        self._reports_dirty = True
+        QTimer.singleShot(0, self._flush_use_case_reports)
+
+    def _flush_use_case_reports(self) -> None:
+        if not self._reports_dirty:
+            return
+        self._reports_dirty = False
         self._build_use_case_reports()
 
+    def _ensure_use_case_reports(self) -> None:
+        if self._reports_dirty:
+            self._flush_use_case_reports()
+        elif not self._use_case_reports:
+            self._build_use_case_reports()
+
     def _build_use_case_reports(self) -> None:
-        if not self._current_graph or self._building_reports:
+        if not self._current_graph or self._building_reports or self._batch_mode:
             return
         self._building_reports = True
         try:
@@ -860,19 +1327,36 @@ class MainWindow(QMainWindow):
                 self._run_smell_analysis()
             if not self._bc_analysis or not self._event_readiness or not self._smell_summary:
                 return
-            self._use_case_reports = build_use_case_reports(
-                self._current_graph,
-                self._violations_by_component,
-                self._smell_summary,
-                self._event_readiness,
-                self._bc_analysis,
+            if _same_inputs(self._report_inputs(), self._reports_inputs):
+                return
+            self._set_use_case_reports(
+                build_use_case_reports(
+                    self._current_graph,
+                    self._violations_by_component,
+                    self._smell_summary,
+                    self._event_readiness,
+                    self._bc_analysis,
+                )
             )
-            self._suppress_report_focus = True
-            self.report_panel.set_reports(self._use_case_reports)
-            self._suppress_report_focus = False
         finally:
             self._building_reports = False
 
+    def _report_inputs(self) -> tuple:
+        return (
+            self._current_graph,
+            self._violations,
+            self._smell_summary,
+            self._event_readiness,
+            self._bc_analysis,
+        )
+
+    def _set_use_case_reports(self, reports: UseCaseReportSet) -> None:
+        self._use_case_reports = reports
+        self._suppress_report_focus = True
+        self.report_panel.set_reports(reports)
+        self._suppress_report_focus = False
+        self._reports_inputs = self._report_inputs()
+
     def _load_target_spec(self) -> None:
         return
 
@@ -889,8 +1373,9 @@ class MainWindow(QMainWindow):
     def _rebuild_migration_plan(self) -> None:
         if not self._current_graph or not self._target_spec:
             return
-        if not self._use_case_reports:
-            self._build_use_case_reports()
+        self._ensure_use_case_reports()
+        if self._rules_summary is None:
+            self._run_rule_check()
         if not self._event_readiness:
             self._event_readiness = analyze_project_event_readiness(
                 self._current_graph, self._violations_by_component
@@ -901,10 +1386,24 @@ class MainWindow(QMainWindow):
             self._run_bounded_context_analysis()
         if not self._use_case_reports or not self._bc_analysis or not self._smell_summary:
             return
+        inputs = (
+            self._current_graph,
+            self._target_spec,
+            self._rules_summary,
+            self._violations,
+            self._smell_summary,
+            self._event_readiness,
+            self._bc_analysis,
+            self._use_case_reports,
+            self.project_root,
+        )
+        if self._migration_plan and _same_inputs(inputs, self._migration_inputs):
+            self.migration_panel.set_status("마이그레이션 계획이 최신 상태입니다.")
+            return
         self._migration_plan = build_migration_plan(
             current_graph=self._current_graph,
             target_spec=self._target_spec,
-            rules_summary=run_rule_analysis(self._current_graph)[1],
+            rules_summary=self._rules_summary,
             rules_index=self._violations_by_component,
             smells_summary=self._smell_summary,
             event_readiness=self._event_readiness,
@@ -912,6 +1411,7 @@ class MainWindow(QMainWindow):
             use_case_reports=self._use_case_reports,
             current_project_name=str(self.project_root) if self.project_root else "현재 프로젝트",
         )
+        self._migration_inputs = inputs
         self.migration_panel.set_plan(self._migration_plan)
         self.migration_panel.set_status("마이그레이션 계획이 새로고침되었습니다.")
 
@@ -923,7 +1423,7 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        Path(path).write_text(render_migration_plan_markdown(self._migration_plan), encoding="utf-8")
+        self._start_export(path, partial(iter_migration_plan_markdown, self._migration_plan))
 
     def _export_migration_csv(self) -> None:
         if not self._migration_plan:
@@ -933,7 +1433,7 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        Path(path).write_text(render_migration_plan_csv(self._migration_plan), encoding="utf-8")
+        self._start_export(path, partial(iter_migration_plan_csv, self._migration_plan))
 
     def _export_migration_plain(self) -> None:
         if not self._migration_plan:
@@ -943,13 +1443,31 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        Path(path).write_text(render_migration_plan_plain(self._migration_plan), encoding="utf-8")
+        self._start_export(path, partial(iter_migration_plan_plain, self._migration_plan))
+
+    def _start_export(self, path: str, render) -> None:
+        if path in self._export_workers:
+            self.statusBar().showMessage("같은 파일을 저장하는 중입니다.", 2000)
+            return
+        worker = ExportWorker(Path(path), render)
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.failed.connect(self._on_export_failed)
+        self._export_workers[path] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_finished(self, path: str) -> None:
+        self._export_workers.pop(path, None)
+        self.statusBar().showMessage(f"내보내기 완료: {Path(path).name}", 2000)
+
+    def _on_export_failed(self, path: str, message: str) -> None:
+        self._export_workers.pop(path, None)
+        QMessageBox.warning(self, "내보내기 실패", message)
 
     def _on_migration_item_selected(self, item) -> None:
         if not item:
             return
         if item.related_components:
-            self.scene.set_component_focus(set(item.related_components))
+            self.scene.set_component_focus(self._focus_id_set(item.related_components))
         if item.related_use_cases and self._use_case_reports:
             self.report_panel.select_use_case(item.related_use_cases[0])
             if self._report_dock:
@@ -960,26 +1478,39 @@ class MainWindow(QMainWindow):
             return
         settings_path = self._target_settings_path()
         target_path = None
-        if settings_path.exists():
+        self._saved_target_settings = None
+        root_entries = _dir_entries(self.project_root)
+        subdir_entries = {
+            name: _dir_entries(self.project_root / name)
+            if root_entries is None or name in root_entries
+            else set()
+            for name in (".ddd", "migration")
+        }
+        if _entry_exists(subdir_entries[".ddd"], settings_path):
             try:
-                data = json.loads(settings_path.read_text(encoding="utf-8"))
+                data = read_json(settings_path)
                 saved = data.get("last_target_json_path")
+                if saved:
+                    self._saved_target_settings = (settings_path, saved)
                 if saved and Path(saved).exists():
                     target_path = Path(saved)
             except json.JSONDecodeError:
                 target_path = None
 
         if not target_path:
-            for candidate in [
-                self.project_root / "ddd_target.json",
-                self.project_root / ".ddd" / "target.json",
-                self.project_root / "migration" / "target_architecture.json",
+            for entries, candidate in [
+                (root_entries, self.project_root / "ddd_target.json"),
+                (subdir_entries[".ddd"], self.project_root / ".ddd" / "target.json"),
+                (
+                    subdir_entries["migration"],
+                    self.project_root / "migration" / "target_architecture.json",
+                ),
             ]:
-                if candidate.exists():
+                if _entry_exists(entries, candidate):
                     target_path = candidate
                     break
 
-        if target_path and target_path.exists():
+        if target_path:
             self._load_target_spec_from_path(target_path)
             self._save_target_settings(target_path)
             self.migration_panel.set_status(
@@ -1000,49 +1531,30 @@ class MainWindow(QMainWindow):
     def _generate_default_target_spec(self, path: Path) -> None:
         if not self._bc_analysis:
             self._run_bounded_context_analysis()
-        if not self._use_case_reports:
-            self._build_use_case_reports()
+        self._ensure_use_case_reports()
         if not self._bc_analysis or not self._use_case_reports:
             return
 
-        bounded_contexts = []
-        for bc in self._bc_analysis.contexts.values():
-            prefix = bc.name or "unknown"
-            bounded_contexts.append(
-                {
-                    "id": bc.id,
-                    "name": prefix,
-                    "packagePatterns": [f"{prefix}.*"] if prefix else [],
-                    "expectedLayers": [
-                        "domain",
-                        "application",
-                        "inbound_port",
-                        "outbound_port",
-                        "inbound_adapter",
-                        "outbound_adapter",
-                    ],
-                    "notes": "현재 분석 결과로 자동 생성됨",
-                }
-            )
-
-        use_cases = []
-        for report in self._use_case_reports.reports.values():
-            use_cases.append(
-                {
-                    "id": report.use_case_id,
-                    "name": report.use_case_name,
-                    "boundedContextId": report.bc_summary.entry_bc_id,
-                    "expectedFlowLayers": [
-                        "inbound_adapter",
-                        "inbound_port",
-                        "application",
-                        "domain",
-                        "outbound_port",
-                        "outbound_adapter",
-                    ],
-                    "expectedEvents": [],
-                }
-            )
+        bounded_contexts = [
+            {
+                "id": bc.id,
+                "name": bc.name or "unknown",
+                "packagePatterns": [f"{bc.name or 'unknown'}.*"],
+                "expectedLayers": _BC_EXPECTED_LAYERS,
+                "notes": "현재 분석 결과로 자동 생성됨",
+            }
+            for bc in self._bc_analysis.contexts.values()
+        ]
+        use_cases = [
+            {
+                "id": report.use_case_id,
+                "name": report.use_case_name,
+                "boundedContextId": report.bc_summary.entry_bc_id,
+                "expectedFlowLayers": _USE_CASE_EXPECTED_FLOW,
+                "expectedEvents": [],
+            }
+            for report in self._use_case_reports.reports.values()
+        ]
 
         data = {
             "name": "자동 생성 타깃",
@@ -1054,7 +1566,7 @@ class MainWindow(QMainWindow):
             },
         }
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        write_json(path, data)
 
     def _load_target_spec_from_path(self, path: Path) -> None:
         self._target_spec = load_target_architecture_spec(str(path))
@@ -1067,9 +1579,15 @@ class MainWindow(QMainWindow):
         if not self.project_root:
             return
         settings_path = self._target_settings_path()
+        saved = (settings_path, str(path))
+        if saved == self._saved_target_settings:
+            return
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        settings = {"last_target_json_path": str(path)}
-        settings_path.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+        settings_path.write_text(
+            _TARGET_SETTINGS_TEMPLATE.format(path=encode_basestring(str(path))),
+            encoding="utf-8",
+        )
+        self._saved_target_settings = saved
 
     def _on_bc_selected(self, bc_id: str) -> None:
         if not self._bc_analysis:
@@ -1097,7 +1615,8 @@ class MainWindow(QMainWindow):
     def _clear_bc_filter(self) -> None:
         self.scene.set_bc_filter(None)
         self.context_scene.highlight_bc(None)
-        self.context_panel.clear()
+        if self.context_panel:
+            self.context_panel.clear()
 
     def _wrap_scroll(self, widget: QWidget) -> QScrollArea:
         scroll = QScrollArea()
@@ -1108,79 +1627,67 @@ class MainWindow(QMainWindow):
 
     def _setup_default_layout(self) -> None:
         self.setDockNestingEnabled(True)
-        if self._left_dock:
-            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self._left_dock)
-            self._left_dock.show()
-        if self._inspector_dock:
-            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self._inspector_dock)
-            self._inspector_dock.show()
-
-        if self._inspector_dock and self._rules_dock:
-            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self._rules_dock)
-            self.splitDockWidget(self._inspector_dock, self._rules_dock, Qt.Orientation.Vertical)
-
-        if self._report_dock and self._inspector_dock:
-            self.tabifyDockWidget(self._inspector_dock, self._report_dock)
-
-        analysis_docks = [
-            self._smells_dock,
-            self._readiness_dock,
-            self._context_dock,
-            self._migration_dock,
-        ]
-        for dock in analysis_docks:
-            if dock and self._rules_dock:
-                self.tabifyDockWidget(self._rules_dock, dock)
-
-        if self._left_dock and self._inspector_dock:
-            self.resizeDocks([self._left_dock], [260], Qt.Orientation.Horizontal)
-            self.resizeDocks([self._inspector_dock], [360], Qt.Orientation.Horizontal)
-        if self._inspector_dock and self._rules_dock:
-            self.resizeDocks(
-                [self._inspector_dock, self._rules_dock],
-                [420, 320],
-                Qt.Orientation.Vertical,
-            )
-        if self._inspector_dock:
-            self._inspector_dock.raise_()
+        left = self._left_dock
+        insp = self._inspector_dock
+        rules = self._rules_dock
+        tabify = self.tabifyDockWidget
+        if left:
+            self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, left)
+        if insp:
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, insp)
+
+        if insp and rules:
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, rules)
+            self.splitDockWidget(insp, rules, Qt.Orientation.Vertical)
+
+        if self._report_dock and insp:
+            tabify(insp, self._report_dock)
+
+        if rules:
+            for dock in (
+                self._smells_dock,
+                self._readiness_dock,
+                self._context_dock,
+                self._migration_dock,
+            ):
+                if dock:
+                    tabify(rules, dock)
+
+        # 배치가 끝난 뒤 한 번에 표시해 지오메트리 재계산을 묶는다.
+        if left:
+            left.show()
+        if insp:
+            insp.show()
+
+        if left and insp:
+            self.resizeDocks([left], [260], Qt.Orientation.Horizontal)
+            self.resizeDocks([insp], [360], Qt.Orientation.Horizontal)
+        if insp and rules:
+            self.resizeDocks([insp, rules], [420, 320], Qt.Orientation.Vertical)
+        if insp:
+            insp.raise_()
 
     def _show_component_smells(self, component_id: str) -> None:
-        smells = self._smells_by_component.get(component_id, [])
+        smells = self._smells_by_component.get(component_id, _EMPTY_TUPLE)
         if not smells:
             self.inspector.clear_component_smells()
             return
-        severity_labels = {
-            "info": "정보",
-            "warning": "경고",
-            "error": "오류",
-        }
-        smell_labels = {
-            "anemic_domain": "빈약한 도메인",
-            "god_service": "갓 서비스",
-            "repository_leak": "레포지토리 누수",
-            "cross_aggregate_coupling": "크로스 애그리게잇",
-        }
-        items = [
-            f"[{severity_labels.get(smell.severity.value, smell.severity.value)}] "
-            f"{smell_labels.get(smell.smell_type.value, smell.smell_type.value)}: {smell.description}"
-            for smell in smells
-        ]
-        self.inspector.show_component_smells(items)
+        self.inspector.show_component_smells(self._smell_display_by_component[component_id])
 
     def _on_component_smell_clicked(self, item) -> None:
         component = self.inspector.current_component()
         if not component:
             return
-        smells = self._smells_by_component.get(component.id, [])
+        smells = self._smells_by_component.get(component.id, _EMPTY_TUPLE)
         row = self.inspector.smells_list.currentRow()
         if row < 0 or row >= len(smells):
             return
         smell = smells[row]
-        color = QColor(SMELL_COLORS.get(smell_color_key(smell.smell_type), "#EF4444"))
+        color = SMELL_COLORS.get(smell_color_key(smell.smell_type), _DEFAULT_SMELL_COLOR)
         self.scene.focus_on_smell(smell.component_id, color)
 
     def _on_smell_selected(self, smell) -> None:
-        color = QColor(SMELL_COLORS.get(smell_color_key(smell.smell_type), "#EF4444"))
+        color = SMELL_COLORS.get(smell_color_key(smell.smell_type), _DEFAULT_SMELL_COLOR)
         self.scene.focus_on_smell(smell.component_id, color)
         self._focus_component(smell.component_id)
         if self._smells_dock:
@@ -1189,19 +1696,30 @@ class MainWindow(QMainWindow):
     def _on_report_suggestion_selected(self, component_ids: list) -> None:
         if not component_ids:
             return
-        self.scene.set_component_focus(set(component_ids))
+        self.scene.set_component_focus(self._focus_id_set(component_ids))
+
+    def _focus_id_set(self, component_ids: list[str]) -> frozenset[str]:
+        cached = self._focus_ids_cache
+        if cached is not None and cached[0] is component_ids:
+            return cached[1]
+        ids = frozenset(component_ids)
+        self._focus_ids_cache = (component_ids, ids)
+        return ids
 
     def _run_event_readiness(self) -> None:
         if not self._current_graph:
             return
         self._set_header_status("이벤트 준비도 분석 중", "busy")
-        self._event_readiness = analyze_project_event_readiness(
-            self._current_graph, self._violations_by_component
+        self._event_readiness = self._cached_analysis(
+            "readiness",
+            lambda: analyze_project_event_readiness(
+                self._current_graph, self._violations_by_component
+            ),
         )
         self.readiness_panel.show_results(self._event_readiness)
         if self._readiness_dock:
             self._readiness_dock.raise_()
-        self._build_use_case_reports()
+        self._schedule_use_case_reports()
         self._readiness_done = True
         self._update_header_status()
 
@@ -1209,12 +1727,11 @@ class MainWindow(QMainWindow):
         if not self._current_graph:
             return
         self._soft_focus_component(component_id)
-        flow = compute_flow_path(self._current_graph, component_id)
+        flow = self._flow_path(component_id)
         if flow.nodes:
             self.scene.apply_flow(flow, component_id)
             self._last_flow_nodes = flow.nodes
-        if not self._use_case_reports:
-            self._build_use_case_reports()
+        self._ensure_use_case_reports()
         if self._use_case_reports:
             self.report_panel.select_use_case(component_id)
         if self._report_dock:
@@ -1222,13 +1739,9 @@ class MainWindow(QMainWindow):
 
     def _on_rule_violation_selected(self, violation) -> None:
         self.scene.focus_on_violation(violation)
-        edge = self.scene.edge_lookup.get(
+        edge = self.scene.edge_lookup_bidirectional.get(
             (violation.source_component_id, violation.target_component_id)
         )
-        if not edge and violation.target_component_id:
-            edge = self.scene.edge_lookup.get(
-                (violation.target_component_id, violation.source_component_id)
-            )
         if edge:
             point = edge.path().pointAtPercent(0.5)
             self.view.centerOn(point)
@@ -1241,7 +1754,7 @@ class MainWindow(QMainWindow):
         component = self.inspector.current_component()
         if not component:
             return
-        violations = self._violations_by_component.get(component.id, [])
+        violations = self._violations_by_component.get(component.id, _EMPTY_TUPLE)
         row = self.inspector.violations_list.currentRow()
         if row < 0 or row >= len(violations):
             return
@@ -1251,23 +1764,15 @@ class MainWindow(QMainWindow):
         if not self._violations:
             self.inspector.clear_component_violations()
             return
-        violations = self._violations_by_component.get(component_id, [])
-        severity_labels = {
-            "info": "정보",
-            "warning": "경고",
-            "error": "오류",
-        }
-        items = [
-            f"[{severity_labels.get(v.severity, v.severity)}] {v.rule_id}: {v.message}"
-            for v in violations
-        ]
-        self.inspector.show_component_violations(items)
+        self.inspector.show_component_violations(
+            self._violation_display_by_component.get(component_id, _EMPTY_TUPLE)
+        )
 
     def _show_flow_from_inspector(self) -> None:
         component = self.inspector.current_component()
         if not component or not self._current_graph:
             return
-        flow = compute_flow_path(self._current_graph, component.id)
+        flow = self._flow_path(component.id)
         self.scene.apply_flow(flow, component.id)
         self.inspector.show_flow_steps(self._flow_step_labels(flow))
         self._last_flow_nodes = flow.nodes
@@ -1277,26 +1782,23 @@ class MainWindow(QMainWindow):
         self.inspector.clear_flow()
         if self._flow_animation:
             self._flow_animation.stop()
+            self._set_flow_viewport_mode(False)
+
+    def _flow_path(self, component_id: str) -> FlowResult:
+        flow = self._flow_cache.get(component_id)
+        if flow is None:
+            flow = compute_flow_path(self._current_graph, component_id)
+            self._flow_cache[component_id] = flow
+        return flow
 
     def _flow_step_labels(self, flow) -> list[str]:
-        labels = {
-            "domain": "도메인",
-            "application": "앱",
-            "inbound_port": "인포트",
-            "outbound_port": "아웃포트",
-            "inbound_adapter": "인어댑터",
-            "outbound_adapter": "아웃어댑터",
-            "unknown": "미분류",
-        }
-        steps = []
-        for idx in range(len(flow.nodes) - 1):
-            source = flow.nodes[idx]
-            target = flow.nodes[idx + 1]
-            steps.append(
-                f"[{labels.get(source.layer, source.layer)}] {source.name} → "
-                f"[{labels.get(target.layer, target.layer)}] {target.name}"
-            )
-        return steps
+        label = _LAYER_SHORT_LABELS.get
+        nodes = flow.nodes
+        return [
+            f"[{label(source.layer, source.layer)}] {source.name} → "
+            f"[{label(target.layer, target.layer)}] {target.name}"
+            for source, target in zip(nodes, nodes[1:])
+        ]
 
     def _on_flow_item_clicked(self, item) -> None:
         row = self.inspector.flow_list.currentRow()
@@ -1309,7 +1811,7 @@ class MainWindow(QMainWindow):
         component = self.inspector.current_component()
         if not component or not self._current_graph:
             return
-        flow = compute_flow_path(self._current_graph, component.id)
+        flow = self._flow_path(component.id)
         if not flow.nodes:
             return
         self.scene.apply_flow(flow, component.id)
@@ -1322,44 +1824,48 @@ class MainWindow(QMainWindow):
         self._flow_animation = FlowAnimationController(self.scene, steps)
         self._flow_animation.step_changed.connect(self.inspector.set_active_flow_step)
         self._flow_animation.token_updated.connect(self.minimap.schedule_viewport_update)
+        self._flow_animation.finished.connect(lambda: self._set_flow_viewport_mode(False))
         self._update_flow_speed()
+        self._set_flow_viewport_mode(True)
         self._flow_animation.play()
 
     def _pause_flow_animation(self) -> None:
         if self._flow_animation:
             self._flow_animation.pause()
+            self._set_flow_viewport_mode(False)
 
     def _step_flow_animation(self) -> None:
         if self._flow_animation:
             self._flow_animation.step_forward()
+            self._set_flow_viewport_mode(False)
 
     def _restart_flow_animation(self) -> None:
         if self._flow_animation:
+            self._set_flow_viewport_mode(True)
             self._flow_animation.restart()
 
+    def _set_flow_viewport_mode(self, playing: bool) -> None:
+        # 토큰 하나만 움직이는 동안에는 바뀐 영역만 다시 그린다. GL 뷰포트는 항상 전체 갱신.
+        if playing and not self.view.opengl_viewport:
+            self.view.setViewportUpdateMode(self.view.ViewportUpdateMode.MinimalViewportUpdate)
+        else:
+            self._apply_viewport_update_mode()
+
     def _update_flow_speed(self) -> None:
         if not self._flow_animation:
             return
-        text = self.inspector.flow_speed.currentText().replace("x", "")
-        try:
-            speed = float(text)
-        except ValueError:
-            speed = 1.0
+        speed = FLOW_SPEEDS.get(self.inspector.flow_speed.currentText(), 1.0)
         self._flow_animation.set_speed(speed)
 
     def _build_flow_steps(self, flow) -> list[FlowStep]:
         steps: list[FlowStep] = []
-        node_items = {item.component.id: item for item in self.scene.component_items.values()}
-        edge_items = {}
-        for edge in self.scene.edge_items:
-            edge_items[(edge.source_item.component.id, edge.target_item.component.id)] = edge
+        node_items = self.scene.component_items
+        edge_items = self.scene.edge_lookup_bidirectional
         base_duration = 400
         for idx in range(len(flow.nodes) - 1):
             source = flow.nodes[idx]
             target = flow.nodes[idx + 1]
-            edge = edge_items.get((source.id, target.id)) or edge_items.get(
-                (target.id, source.id)
-            )
+            edge = edge_items.get((source.id, target.id))
             if not edge:
                 continue
             steps.append(
@@ -1395,50 +1901,73 @@ class MainWindow(QMainWindow):
             self._set_header_status("그래프 로딩 완료", "info")
 
     def _show_rules_panel(self) -> None:
+        self._ensure_docks("rules")
         if self._rules_dock:
             self._rules_dock.raise_()
 
     def _show_smells_panel(self) -> None:
+        self._ensure_docks("smells")
         if self._smells_dock:
             self._smells_dock.raise_()
 
     def _show_readiness_panel(self) -> None:
+        self._ensure_docks("readiness")
         if self._readiness_dock:
             self._readiness_dock.raise_()
 
-    def _set_focus_opacity(self, focus_layers: set[str]) -> None:
+    def _set_focus_opacity(self, focus_layers: frozenset[str]) -> None:
+        if focus_layers == self._last_focus_layers:
+            return
+        self._last_focus_layers = focus_layers
+        if not focus_layers:
+            self.scene.reset_layer_opacities()
+            return
         dim_opacity = 0.2
-        layers = [
-            "domain",
-            "application",
-            "inbound_port",
-            "outbound_port",
-            "inbound_adapter",
-            "outbound_adapter",
-            "unknown",
-            "adapter_zone",
-            "ports",
-        ]
-        for layer in layers:
-            if not focus_layers:
-                self.scene.set_layer_opacity(layer, 1.0)
-            else:
-                opacity = 1.0 if layer in focus_layers else dim_opacity
-                self.scene.set_layer_opacity(layer, opacity)
+        set_opacity = self.scene.set_layer_opacity
+        for layer in _FOCUS_OPACITY_LAYERS:
+            set_opacity(layer, 1.0 if layer in focus_layers else dim_opacity)
+
+    def _on_search_text_changed(self, text: str) -> None:
+        self._pending_query = text
+        self._search_timer.start()
+
+    def _run_search(self) -> None:
+        self._search_timer.stop()
+        self._update_search_matches(self._pending_query)
 
     def _update_search_matches(self, text: str) -> None:
         query = text.strip().lower()
+        previous = self._search_query
+        if query == previous:
+            return
+        self._search_query = query
         self.search_matches = []
         self.search_index = 0
         if not query:
+            self._search_rows = []
             return
-        for component_id, item in self.scene.component_items.items():
-            component = item.component
-            haystacks = [component.name.lower(), component.package.lower()]
-            if any(query in haystack for haystack in haystacks):
-                self.search_matches.append(component_id)
+        haystacks = self._search_haystacks
+        # 이전 검색어를 포함하는 검색어라면 이전 결과 안에서만 다시 거른다.
+        if previous and previous in query:
+            candidates = self._search_rows
+        else:
+            candidates = range(len(self._search_ids))
+        self._search_rows = [row for row in candidates if query in haystacks[row]]
+        ids = self._search_ids
+        self.search_matches = [ids[row] for row in self._search_rows]
+
+    def _rebuild_search_index(self) -> None:
+        self._search_query = ""
+        self._search_rows = []
+        items = self.scene.component_items
+        self._search_ids = list(items)
+        self._search_haystacks = [
+            f"{item.component.name}\x1f{item.component.package}".lower() for item in items.values()
+        ]
 
     def _find_next_match(self) -> None:
+        if self._search_timer.isActive():
+            self._run_search()
         if not self.search_matches:
             return
         component_id = self.search_matches[self.search_index % len(self.search_matches)]
@@ -1450,7 +1979,8 @@ class MainWindow(QMainWindow):
         if not item:
             return
         self.scene.set_active_component(component_id)
-        self.inspector.show_component(item.component)
+        if self.inspector.current_component() is not item.component:
+            self.inspector.show_component(item.component)
         item.flash(3)
         rect = item.sceneBoundingRect().adjusted(-160, -160, 160, 160)
         self.view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
@@ -1501,84 +2031,7 @@ class MainWindow(QMainWindow):
             self._pending_focus_component_id = None
 
     def _apply_toolbar_styles(self, toolbar: QToolBar) -> None:
-        colors = self._get_theme_colors()
-        toolbar.setStyleSheet(
-            f"""
-            QToolBar {{
-                spacing: 10px;
-                padding: 8px;
-                background: {colors['surface']};
-                border-bottom: 1px solid {colors['border']};
-            }}
-            QLineEdit {{
-                padding: 7px 10px;
-                border-radius: 10px;
-                border: 1px solid {colors['border']};
-                background: {colors['surface']};
-                color: {colors['text']};
-            }}
-            QLineEdit:focus {{
-                border-color: {colors['accent']};
-            }}
-            QComboBox {{
-                padding: 7px 10px;
-                border-radius: 10px;
-                border: 1px solid {colors['border']};
-                background: {colors['surface']};
-                color: {colors['text']};
-            }}
-            QComboBox:focus {{
-                border-color: {colors['accent']};
-            }}
-            QToolButton {{
-                padding: 7px 12px;
-                border-radius: 10px;
-                background: {colors['surface_alt']};
-                color: {colors['text']};
-                border: 1px solid {colors['border']};
-            }}
-            QToolButton:hover {{
-                background: {colors['accent_soft']};
-                border-color: {colors['accent']};
-            }}
-            QLabel#toolbarGroupLabel {{
-                color: {colors['text_muted']};
-                font-size: 11px;
-                font-weight: 600;
-                padding: 0 4px;
-            }}
-            QLabel#toolbarStatusLabel {{
-                padding: 4px 10px;
-                border-radius: 10px;
-                background: {colors['surface_alt']};
-                color: {colors['text']};
-                font-weight: 600;
-            }}
-            QLabel#toolbarStatusLabel[tone="busy"] {{
-                background: {colors['accent_soft']};
-                color: {colors['text']};
-            }}
-            QLabel#toolbarStatusLabel[tone="success"] {{
-                background: {colors['accent_soft']};
-                color: {colors['text']};
-            }}
-            QLabel#toolbarStatusLabel[tone="idle"] {{
-                background: {colors['surface_alt']};
-                color: {colors['text_muted']};
-            }}
-            QToolButton#toolbarActionButton {{
-                padding: 6px 10px;
-                border-radius: 10px;
-                background: {colors['surface']};
-                color: {colors['text']};
-                border: 1px solid {colors['border']};
-            }}
-            QToolButton#toolbarActionButton:hover {{
-                background: {colors['accent_soft']};
-                border-color: {colors['accent']};
-            }}
-            """
-        )
+        toolbar.setStyleSheet(_TOOLBAR_STYLE_TEMPLATE.format_map(self._get_theme_colors()))
 
     def start_watch(self, project_root: Path, interval_ms: int = 1000) -> None:
         self._watch_root = project_root
@@ -1591,31 +2044,41 @@ class MainWindow(QMainWindow):
         self._set_header_status("파일 변경 감지 활성화", "info")
 
     def _poll_watch_changes(self) -> None:
-        if self._watch_in_progress or not self._watch_root:
+        if not self._watch_root:
             return
         current = self._snapshot_project_files()
-        if current == self._watch_snapshot:
-            return
+        changed = _watch_snapshot_changed(self._watch_snapshot, current)
         self._watch_snapshot = current
-        self._run_watch_analysis()
+        if not changed:
+            return
+        if self._watch_in_progress:
+            # 재분석 중에 바뀐 파일은 끝난 뒤 한 번 더 분석한다.
+            self._watch_rerun = True
+            return
+        # 연달아 저장되는 동안은 기다렸다가 잠잠해지면 한 번만 재분석한다.
+        self._watch_debounce_timer.start()
+
+    def _resume_pending_watch(self) -> None:
+        if self._pending_watch_root:
+            root = self._pending_watch_root
+            self._pending_watch_root = None
+            self.start_watch(root)
+            return
+        if self._watch_rerun:
+            self._watch_rerun = False
+            self._watch_debounce_timer.start()
 
     def _run_watch_analysis(self) -> None:
         if not self._watch_root:
             return
+        if not self._start_analysis(self._watch_root):
+            # 다른 분석이 도는 중이면 끝난 뒤 다시 시도한다.
+            self._watch_rerun = True
+            return
         self._watch_in_progress = True
-        output_path = self._watch_root / "architecture.json"
         self._set_header_status("파일 변경 감지 · 재분석 중", "busy")
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        try:
-            graph = analyze_project(self._watch_root, output_path)
-        finally:
-            QApplication.restoreOverrideCursor()
-        self._load_graph(graph)
-        self._set_header_status("재분석 완료", "success")
-        self._watch_snapshot = self._snapshot_project_files()
-        self._watch_in_progress = False
 
-    def _snapshot_project_files(self) -> dict[str, float]:
+    def _snapshot_project_files(self) -> dict[str, tuple[float, bytes | None]]:
         if not self._watch_root:
             return {}
         ignore_dirs = {
@@ -1629,8 +2092,10 @@ class MainWindow(QMainWindow):
             "target",
             ".idea",
         }
-        ignore_files = {"architecture.json", ".DS_Store"}
-        snapshot: dict[str, float] = {}
+        # architecture.json, ddd_target.json, .ddd/ 는 창이 직접 쓰는 파일이라 변경으로 보지 않는다.
+        ignore_files = {"architecture.json", "ddd_target.json", ".DS_Store"}
+        previous = self._watch_snapshot
+        snapshot: dict[str, tuple[float, bytes | None]] = {}
         for path in self._watch_root.rglob("*"):
             if not path.is_file():
                 continue
@@ -1638,39 +2103,22 @@ class MainWindow(QMainWindow):
                 continue
             if any(part in ignore_dirs for part in path.parts):
                 continue
+            key = str(path)
             try:
-                snapshot[str(path)] = path.stat().st_mtime
+                mtime = path.stat().st_mtime
+                entry = previous.get(key)
+                if entry is None or entry[0] != mtime:
+                    digest = None
+                    if path.suffix in _WATCH_HASHED_SUFFIXES:
+                        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+                    entry = (mtime, digest)
             except OSError:
                 continue
+            snapshot[key] = entry
         return snapshot
 
     def _get_theme_colors(self) -> dict:
-        from core.config import ThemeManager, Theme
-        if ThemeManager.get_theme() == Theme.DARK:
-            return {
-                "background": "#12161C",
-                "surface": "#1B222B",
-                "surface_alt": "#232C37",
-                "border": "#2B3642",
-                "text": "#E6EDF5",
-                "text_muted": "#A7B2C1",
-                "accent": "#4B7CFF",
-                "accent_soft": "#203358",
-                "grid": "#1F2731",
-                "grid_bold": "#2A3642",
-            }
-        return {
-            "background": "#F2F4F6",
-            "surface": "#FFFFFF",
-            "surface_alt": "#F7F9FB",
-            "border": "#D5DADF",
-            "text": "#1F2937",
-            "text_muted": "#556070",
-            "accent": "#2156D8",
-            "accent_soft": "#E6EEFF",
-            "grid": "#E3E8EE",
-            "grid_bold": "#D3DAE3",
-        }
+        return _DARK_COLORS if ThemeManager.get_theme() == Theme.DARK else _LIGHT_COLORS
 
     def _build_grid_brush(self, colors: dict) -> QBrush:
         size = 64
@@ -1692,122 +2140,34 @@ class MainWindow(QMainWindow):
         return QBrush(pixmap)
 
     def _toggle_theme(self) -> None:
-        from core.config import ThemeManager, Theme
         new_theme = ThemeManager.toggle_theme()
         self._apply_theme()
         theme_name = "다크" if new_theme == Theme.DARK else "라이트"
         self.statusBar().showMessage(f"{theme_name} 테마로 전환했습니다.", 2000)
 
     def _apply_theme(self) -> None:
-        from core.config import ThemeManager, Theme
         colors = self._get_theme_colors()
-        
-        # 배경색 변경
-        self.view.setBackgroundBrush(self._build_grid_brush(colors))
-        self.view.apply_overlay_theme(ThemeManager.get_theme() == Theme.LIGHT)
-        if self.minimap:
-            self.minimap.apply_theme(ThemeManager.get_theme())
-        
-        # 툴바 스타일 업데이트
-        for toolbar in self.findChildren(QToolBar):
-            self._apply_toolbar_styles(toolbar)
-        
-        # 메인 윈도우 스타일시트
-        self.setStyleSheet(f"""
-            QMainWindow {{ background: {colors['background']}; }}
-            QDockWidget {{
-                background: {colors['surface']};
-                color: {colors['text']};
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                titlebar-close-icon: url(none);
-            }}
-            QDockWidget::title {{
-                background: {colors['surface']};
-                padding: 10px 12px;
-                font-family: 'Gmarket Sans';
-                font-weight: 700;
-                border-bottom: 1px solid {colors['border']};
-            }}
-            QDockWidget QWidget {{
-                background: {colors['surface']};
-                color: {colors['text']};
-            }}
-            QScrollArea {{
-                border: none;
-                background: {colors['surface']};
-            }}
-            QGroupBox {{
-                border: 1px solid {colors['border']};
-                border-radius: 10px;
-                margin-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 6px;
-                color: {colors['text_muted']};
-            }}
-            QMenuBar {{
-                background: {colors['surface']};
-                color: {colors['text']};
-            }}
-            QMenuBar::item:selected {{ background: {colors['accent_soft']}; }}
-            QMenu {{
-                background: {colors['surface']};
-                color: {colors['text']};
-                border: 1px solid {colors['border']};
-            }}
-            QMenu::item:selected {{ background: {colors['accent_soft']}; }}
-            QStatusBar {{
-                background: {colors['surface']};
-                color: {colors['text_muted']};
-            }}
-            QListWidget, QTableWidget, QTextEdit, QTreeWidget {{
-                background: {colors['surface_alt']};
-                color: {colors['text']};
-                border: 1px solid {colors['border']};
-                border-radius: 8px;
-            }}
-            QTableWidget {{
-                gridline-color: {colors['border']};
-                alternate-background-color: {colors['surface']};
-            }}
-            QTableWidget::item, QListWidget::item, QTreeWidget::item {{
-                padding: 6px 8px;
-            }}
-            QTableWidget::item:selected, QListWidget::item:selected, QTreeWidget::item:selected {{
-                background: {colors['accent_soft']};
-                color: {colors['text']};
-            }}
-            QHeaderView::section {{
-                background: {colors['surface']};
-                color: {colors['text_muted']};
-                border: 1px solid {colors['border']};
-                padding: 6px 8px;
-                font-weight: 600;
-            }}
-            QPushButton {{
-                background: {colors['accent']};
-                color: white;
-                border-radius: 8px;
-                padding: 7px 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background: {colors['accent']};
-                opacity: 0.9;
-            }}
-            QPushButton:disabled {{
-                background: {colors['border']};
-                color: {colors['text_muted']};
-            }}
-        """)
+        # 스타일 변경을 한 번의 repaint로 묶음
+        self.setUpdatesEnabled(False)
+        try:
+            # 배경색 변경
+            self.view.setBackgroundBrush(self._build_grid_brush(colors))
+            self.view.apply_overlay_theme(ThemeManager.get_theme() == Theme.LIGHT)
+            if self.minimap:
+                self.minimap.apply_theme(ThemeManager.get_theme())
+
+            # 툴바 스타일 업데이트
+            for toolbar in self._toolbars:
+                self._apply_toolbar_styles(toolbar)
+
+            # 메인 윈도우 스타일시트
+            self.setStyleSheet(_WINDOW_STYLE_TEMPLATE.format_map(colors))
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
 
     def _show_onboarding(self) -> None:
         """Show onboarding overlay for first-time users"""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("DDD Architecture Viewer 시작하기")
         dialog.setMinimumSize(500, 400)
@@ -1870,5 +2230,4 @@ class MainWindow(QMainWindow):
         if not hasattr(self, '_onboarding_shown'):
             self._onboarding_shown = True
             if not self._current_graph:
-                from PySide6.QtCore import QTimer
                 QTimer.singleShot(500, self._show_onboarding)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from typing import Dict, Iterable, List
 
-from PySide6.QtCore import QPointF, Qt
+from PySide6.QtCore import QPointF, Qt, Signal
 from PySide6.QtGui import QColor, QLinearGradient, QPainterPath, QPen, QPolygonF
 from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsPolygonItem, QGraphicsScene
 
@@ -16,6 +16,12 @@ from ui.colors import STROKE_COLOR
 
 
 class ArchitectureScene(QGraphicsScene):
+    # ComponentItem이 자신이 속한 씬을 통해 발생시킨다.
+    component_clicked = Signal(object)
+    component_hovered = Signal(object, bool)
+    component_double_clicked = Signal(object)
+    component_moved = Signal()
+
     def __init__(self, layout: LayoutConfig | None = None) -> None:
         super().__init__()
         self.layout = layout or LayoutConfig()
@@ -27,9 +33,14 @@ class ArchitectureScene(QGraphicsScene):
         self.component_edges_out: Dict[str, List[EdgeItem]] = {}
         self.edge_items: List[EdgeItem] = []
         self.edge_lookup: Dict[tuple[str, str], EdgeItem] = {}
+        # (a, b) -> edge a->b if present, otherwise edge b->a; one probe for either direction.
+        self.edge_lookup_bidirectional: Dict[tuple[str, str], EdgeItem] = {}
+        # 레이어별 마지막 가시성. 새 아이템은 보이는 상태로 생성된다.
+        self._layer_visible: Dict[str, bool] = {}
         self.active_component_id: str | None = None
         self.flow_active = False
         self.flow_token_pos: QPointF | None = None
+        self.component_hovered.connect(self._handle_component_hover)
 
     def load_graph(self, graph: Graph) -> None:
         self.clear()
@@ -41,6 +52,8 @@ class ArchitectureScene(QGraphicsScene):
         self.component_edges_out.clear()
         self.edge_items.clear()
         self.edge_lookup.clear()
+        self.edge_lookup_bidirectional.clear()
+        self._layer_visible.clear()
         self.active_component_id = None
         self.flow_active = False
 
@@ -49,6 +62,9 @@ class ArchitectureScene(QGraphicsScene):
         self._create_edges(graph.dependencies)
 
     def set_layer_visible(self, layer: str, visible: bool) -> None:
+        if self._layer_visible.get(layer, True) == visible:
+            return
+        self._layer_visible[layer] = visible
         for item in self.layer_items.get(layer, []):
             item.setVisible(visible)
         for item in self.layer_backgrounds.get(layer, []):
@@ -60,6 +76,14 @@ class ArchitectureScene(QGraphicsScene):
         for item in self.layer_backgrounds.get(layer, []):
             item.setOpacity(opacity)
 
+    def reset_layer_opacities(self) -> None:
+        for items in self.layer_items.values():
+            for item in items:
+                item.setOpacity(1.0)
+        for items in self.layer_backgrounds.values():
+            for item in items:
+                item.setOpacity(1.0)
+
     def draw_layer_backgrounds(self) -> None:
         scene_radius = self.layout.unknown_radius + 220
         self.setSceneRect(-scene_radius, -scene_radius, scene_radius * 2, scene_radius * 2)
@@ -273,7 +297,6 @@ class ArchitectureScene(QGraphicsScene):
             self.addItem(item)
             self.component_items[component.id] = item
             self.layer_items.setdefault(component.layer, []).append(item)
-            item.hovered.connect(self._handle_component_hover)
 
     def _create_edges(self, dependencies: Iterable[Dependency]) -> None:
         for dep in dependencies:
@@ -290,6 +313,9 @@ class ArchitectureScene(QGraphicsScene):
             self.component_edges_in.setdefault(dep.target_id, []).append(edge)
             self.edge_items.append(edge)
             self.edge_lookup[(dep.source_id, dep.target_id)] = edge
+            self.edge_lookup_bidirectional[(dep.source_id, dep.target_id)] = edge
+            if (dep.target_id, dep.source_id) not in self.edge_lookup:
+                self.edge_lookup_bidirectional[(dep.target_id, dep.source_id)] = edge
 
     def _layout_nodes_by_layer(self, components: List[Component]) -> Dict[str, QPointF]:
         layers: Dict[str, List[Component]] = {}
@@ -475,9 +501,7 @@ class ArchitectureScene(QGraphicsScene):
             if not violation.target_component_id:
                 continue
             key = (violation.source_component_id, violation.target_component_id)
-            edge = self.edge_lookup.get(key)
-            if not edge:
-                edge = self.edge_lookup.get((violation.target_component_id, violation.source_component_id))
+            edge = self.edge_lookup_bidirectional.get(key)
             if edge:
                 edge.set_violation(violation.severity)
 
@@ -501,14 +525,16 @@ class ArchitectureScene(QGraphicsScene):
         if item:
             item.set_smell_active(color)
 
-    def set_bc_filter(self, component_ids: set[str] | None) -> None:
+    def set_bc_filter(self, component_ids: Iterable[str] | None) -> None:
         self._animate_opacity_filter(component_ids, mode="bc")
 
-    def set_component_focus(self, component_ids: set[str] | None) -> None:
+    def set_component_focus(self, component_ids: Iterable[str] | None) -> None:
         self._animate_opacity_filter(component_ids, mode="focus")
 
-    def _animate_opacity_filter(self, component_ids: set[str] | None, mode: str = "bc") -> None:
+    def _animate_opacity_filter(self, component_ids: Iterable[str] | None, mode: str = "bc") -> None:
         """부드러운 투명도 애니메이션으로 필터 적용"""
+        if component_ids is not None and not isinstance(component_ids, (set, frozenset)):
+            component_ids = set(component_ids)
         from PySide6.QtCore import QPropertyAnimation, QParallelAnimationGroup
         
         # 애니메이션 그룹 생성
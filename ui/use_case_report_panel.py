@@ -18,7 +18,7 @@ from analysis.use_case_report import UseCaseReport, UseCaseReportSet
 class UseCaseReportPanel(QWidget):
     step_selected = Signal(int)
     export_requested = Signal()
-    suggestion_selected = Signal(list)
+    suggestion_selected = Signal(object)
 
     def __init__(self) -> None:
         super().__init__()
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtCore import QPointF, Qt, Signal
-from PySide6.QtGui import QPainter
+from PySide6.QtGui import QOpenGLContext, QPainter, QSurfaceFormat
 from PySide6.QtWidgets import QGraphicsView, QHBoxLayout, QToolButton, QWidget
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+
+@lru_cache(maxsize=None)
+def _opengl_supported() -> bool:
+    # offscreen 등 OpenGL 컨텍스트를 만들 수 없는 플랫폼에서는 래스터 뷰포트를 유지한다.
+    return QOpenGLWidget is not None and QOpenGLContext().create()
+
+
+def install_opengl_viewport(view: QGraphicsView) -> bool:
+    """가능하면 뷰포트를 QOpenGLWidget으로 교체한다.
+
+    뷰포트 위에 오버레이 위젯을 만들기 전에 호출해야 한다.
+    """
+    if not _opengl_supported():
+        return False
+    viewport = QOpenGLWidget()
+    # 멀티샘플링이 없으면 GL 뷰포트에서 Antialiasing 렌더 힌트가 먹지 않는다.
+    fmt = QSurfaceFormat()
+    fmt.setSamples(4)
+    viewport.setFormat(fmt)
+    view.setViewport(viewport)
+    # QOpenGLWidget은 부분 갱신 이점이 없으므로 항상 전체를 다시 그린다.
+    view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+    return True
+
 
 class ArchitectureView(QGraphicsView):
     viewport_changed = Signal()
@@ -18,13 +49,15 @@ class ArchitectureView(QGraphicsView):
         self._panning = False
         self._last_pan_point: QPointF | None = None
         self._minimap = None
+        self.opengl_viewport = install_opengl_viewport(self)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
-        # 성능 최적화: MinimalViewportUpdate로 더 공격적인 컬링
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        if not self.opengl_viewport:
+            # 성능 최적화: MinimalViewportUpdate로 더 공격적인 컬링
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
         self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
         self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)